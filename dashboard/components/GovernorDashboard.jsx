@@ -3278,11 +3278,20 @@ function ConversationsTab() {
   const fetchTimeline = useCallback(async (convId) => {
     setLoadingTimeline(true);
     try {
-      const resp = await fetch(`${API_BASE}/conversations/${encodeURIComponent(convId)}/timeline`, { headers: hdrs() });
-      if (resp.ok) {
+      // Long timelines are paged — follow next_cursor until the last page
+      const base = `${API_BASE}/conversations/${encodeURIComponent(convId)}/timeline`;
+      let entries = [];
+      let cursor = null;
+      do {
+        const url = cursor ? `${base}?cursor=${encodeURIComponent(cursor)}` : base;
+        const resp = await fetch(url, { headers: hdrs() });
+        if (!resp.ok) break;
         const data = await resp.json();
-        setTimeline(Array.isArray(data) ? data : (data.timeline || []));
-      }
+        if (Array.isArray(data)) { entries = data; break; }
+        entries = entries.concat(data.timeline || []);
+        cursor = data.truncated ? data.next_cursor : null;
+      } while (cursor);
+      setTimeline(entries);
     } catch (e) { /* silent */ }
     finally { setLoadingTimeline(false); }
   }, [API_BASE]);
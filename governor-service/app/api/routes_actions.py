@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-import json
 import logging
 import secrets
 import time as _time
 from datetime import datetime, timezone
 from typing import List
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException
 from sqlalchemy import select
 
+from .. import json_codec
 from ..auth.dependencies import require_any, require_operator
 from ..config import settings
-from ..database import db_session
+from ..database import db_session, run_in_db
 from ..escalation.engine import handle_post_evaluation
 from ..event_bus import ActionEvent, action_bus
 from ..models import ActionLog, TraceSpan, User
 from ..modules import modules as gov_modules
+from ..pagination import cursor_headers, keyset_page, split_page
 from ..policies.engine import evaluate_action
 from ..schemas import ActionInput, ActionDecision, ActionLogRead
 from ..telemetry.logger import log_action
@@ -25,6 +26,9 @@ from .routes_surge import create_governance_receipt, check_wallet_balance
 router = APIRouter(prefix="/actions", tags=["actions"])
 _log = logging.getLogger("governor.actions")
 
+# Built once; handlers clone it with .where() per request
+_LIST_ACTIONS_BASE = select(ActionLog)
+
 
 def _create_governance_span(
     action: ActionInput, decision: ActionDecision, eval_start: datetime,
@@ -34,6 +38,10 @@ def _create_governance_span(
     This links the Governor's evaluation into the agent's trace tree so
     GET /traces/{trace_id} shows governance decisions inline with the
     agent's own reasoning and tool-call spans.
+
+    ``context.trace_deep`` (default ``settings.trace_deep_default``) controls
+    whether the per-layer trace and the input/output payloads are recorded;
+    with it off the span keeps only the decision summary attributes.
     """
     ctx = action.context or {}
     trace_id = ctx.get("trace_id")
@@ -52,13 +60,21 @@ def _create_governance_span(
     }
     if decision.chain_pattern:
         attrs["governor.chain_pattern"] = decision.chain_pattern
-    trace_steps = [
-        {"layer": s.layer, "name": s.name, "outcome": s.outcome,
-         "risk": s.risk_contribution, "matched": s.matched_ids,
-         "duration_ms": s.duration_ms}
-        for s in decision.execution_trace
-    ]
-    attrs["governor.trace"] = trace_steps
+
+    input_text = output_text = None
+    if ctx.get("trace_deep", settings.trace_deep_default):
+        attrs["governor.trace"] = [
+            {"layer": s.layer, "name": s.name, "outcome": s.outcome,
+             "risk": s.risk_contribution, "matched": s.matched_ids,
+             "duration_ms": s.duration_ms}
+            for s in decision.execution_trace
+        ]
+        input_text = json_codec.dumps({"tool": action.tool, "args": action.args})
+        output_text = json_codec.dumps({
+            "decision": decision.decision,
+            "risk_score": decision.risk_score,
+            "explanation": decision.explanation,
+        })
 
     span_id = f"gov-{secrets.token_hex(12)}"
 
@@ -75,13 +91,9 @@ def _create_governance_span(
             duration_ms=round(dur, 2),
             agent_id=ctx.get("agent_id"),
             session_id=ctx.get("session_id"),
-            attributes_json=json.dumps(attrs),
-            input_text=json.dumps({"tool": action.tool, "args": action.args}),
-            output_text=json.dumps({
-                "decision": decision.decision,
-                "risk_score": decision.risk_score,
-                "explanation": decision.explanation,
-            }),
+            attributes_json=json_codec.dumps(attrs),
+            input_text=input_text,
+            output_text=output_text,
         )
         session.add(row)
 
@@ -89,6 +101,7 @@ def _create_governance_span(
 @router.post("/evaluate", response_model=ActionDecision)
 def evaluate_action_route(
     action: ActionInput,
+    background: BackgroundTasks,
     _user: User = Depends(require_operator),
 ) -> ActionDecision:
     """Evaluate a tool call and return a governance decision.
@@ -150,8 +163,8 @@ def evaluate_action_route(
     latency_ms = (_time.perf_counter() - t0) * 1000
     log_action(action, decision)
 
-    # Auto-create governance span if trace_id in context
-    _create_governance_span(action, decision, eval_start)
+    # Auto-create governance span if trace_id in context (after the response)
+    background.add_task(_create_governance_span, action, decision, eval_start)
 
     # Broadcast to real-time SSE subscribers
     action_bus.publish(
@@ -170,40 +183,12 @@ def evaluate_action_route(
         )
     )
 
-    # Generate SURGE governance receipt (v2 when enabled, v1 fallback)
-    if settings.surge_v2_enabled and gov_modules.surge_engine:
-        try:
-            gov_modules.surge_engine.issue(
-                tool=action.tool,
-                decision=decision.decision,
-                risk_score=decision.risk_score,
-                explanation=decision.explanation or "",
-                policy_ids=decision.policy_ids or [],
-                chain_pattern=decision.chain_pattern,
-                agent_id=agent_id,
-                session_id=session_id,
-            )
-        except Exception as exc:
-            _log.warning("SURGE v2 receipt error (falling back to v1): %s", exc)
-            create_governance_receipt(
-                tool=action.tool,
-                decision=decision.decision,
-                risk_score=decision.risk_score,
-                policy_ids=decision.policy_ids,
-                chain_pattern=decision.chain_pattern,
-                agent_id=agent_id,
-            )
-    else:
-        create_governance_receipt(
-            tool=action.tool,
-            decision=decision.decision,
-            risk_score=decision.risk_score,
-            policy_ids=decision.policy_ids,
-            chain_pattern=decision.chain_pattern,
-            agent_id=agent_id,
-        )
+    # SURGE receipt — the client never waits on it
+    background.add_task(_issue_receipt, action.tool, decision, agent_id, session_id)
 
     # ── Escalation: review queue + auto-kill-switch + webhooks ──
+    # The auto-kill-switch check runs inline so auto_ks_triggered is accurate
+    # for every decision; an allow's notifications can trail the response.
     escalation = handle_post_evaluation(
         tool=action.tool,
         decision=decision.decision,
@@ -213,6 +198,7 @@ def evaluate_action_route(
         chain_pattern=decision.chain_pattern,
         agent_id=agent_id,
         session_id=session_id,
+        defer_notifications=background.add_task if decision.decision == "allow" else None,
     )
     decision.escalation_id = escalation.get("escalation_id")
     decision.auto_ks_triggered = escalation.get("auto_ks_triggered", False)
@@ -224,6 +210,38 @@ def evaluate_action_route(
     return decision
 
 
+def _issue_receipt(
+    tool: str,
+    decision: ActionDecision,
+    agent_id: str | None,
+    session_id: str | None,
+) -> None:
+    """Generate the SURGE governance receipt (v2 when enabled, v1 fallback)."""
+    if settings.surge_v2_enabled and gov_modules.surge_engine:
+        try:
+            gov_modules.surge_engine.issue(
+                tool=tool,
+                decision=decision.decision,
+                risk_score=decision.risk_score,
+                explanation=decision.explanation or "",
+                policy_ids=decision.policy_ids or [],
+                chain_pattern=decision.chain_pattern,
+                agent_id=agent_id,
+                session_id=session_id,
+            )
+            return
+        except Exception as exc:
+            _log.warning("SURGE v2 receipt error (falling back to v1): %s", exc)
+    create_governance_receipt(
+        tool=tool,
+        decision=decision.decision,
+        risk_score=decision.risk_score,
+        policy_ids=decision.policy_ids,
+        chain_pattern=decision.chain_pattern,
+        agent_id=agent_id,
+    )
+
+
 def _run_post_eval_hooks(
     action: ActionInput,
     decision: ActionDecision,
@@ -357,45 +375,63 @@ def _run_post_eval_hooks(
             _log.warning("Escalation connector error: %s", exc)
 
 
-@router.get("", response_model=List[ActionLogRead])
-def list_actions(
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": List[ActionLogRead]}},
+)
+async def list_actions(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     tool: str | None = Query(None, description="Filter by tool name"),
     decision: str | None = Query(None, description="Filter by decision (allow/block/review)"),
     agent_id: str | None = Query(None, description="Filter by agent_id"),
+    cursor: str | None = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
     _user: User = Depends(require_any),
-) -> List[ActionLogRead]:
-    """List recent governed actions with optional filters."""
-    with db_session() as session:
-        stmt = select(ActionLog).order_by(ActionLog.created_at.desc())
-        if tool:
-            stmt = stmt.where(ActionLog.tool == tool)
-        if decision:
-            stmt = stmt.where(ActionLog.decision == decision)
-        if agent_id:
-            stmt = stmt.where(ActionLog.agent_id == agent_id)
-        stmt = stmt.offset(offset).limit(limit)
-
-        rows = session.execute(stmt).scalars().all()
-        return [
-            ActionLogRead(
-                id=r.id,
-                created_at=r.created_at,
-                tool=r.tool,
-                decision=r.decision,
-                risk_score=r.risk_score,
-                explanation=r.explanation,
-                policy_ids=[p for p in (r.policy_ids or "").split(",") if p],
-                agent_id=r.agent_id,
-                session_id=r.session_id,
-                user_id=r.user_id,
-                channel=r.channel,
-                trace_id=r.trace_id,
-                span_id=r.span_id,
-                conversation_id=r.conversation_id,
-                turn_id=r.turn_id,
-                chain_pattern=r.chain_pattern,
-            )
-            for r in rows
-        ]
+) -> json_codec.JSONResponse:
+    """List recent governed actions with optional filters.
+
+    Pass ``cursor`` (from the ``X-Next-Cursor`` header) instead of ``offset``
+    for constant-cost paging through deep history.
+
+    Rows are trusted DB data in the ``ActionLogRead`` shape, so they are
+    serialised straight to JSON without a Pydantic validation pass.
+    """
+    def _query() -> tuple[list[dict], str | None]:
+        with db_session() as session:
+            stmt = _LIST_ACTIONS_BASE
+            if tool:
+                stmt = stmt.where(ActionLog.tool == tool)
+            if decision:
+                stmt = stmt.where(ActionLog.decision == decision)
+            if agent_id:
+                stmt = stmt.where(ActionLog.agent_id == agent_id)
+            stmt = keyset_page(stmt, ActionLog.created_at, ActionLog.id, cursor, limit)
+            if offset and not cursor:
+                stmt = stmt.offset(offset)
+
+            rows, next_cursor = split_page(session.execute(stmt).scalars().all(), limit)
+            return [
+                {
+                    "id": r.id,
+                    "created_at": r.created_at,
+                    "tool": r.tool,
+                    "decision": r.decision,
+                    "risk_score": r.risk_score,
+                    "explanation": r.explanation,
+                    "policy_ids": r.policy_ids,
+                    "agent_id": r.agent_id,
+                    "session_id": r.session_id,
+                    "user_id": r.user_id,
+                    "channel": r.channel,
+                    "trace_id": r.trace_id,
+                    "span_id": r.span_id,
+                    "conversation_id": r.conversation_id,
+                    "turn_id": r.turn_id,
+                    "chain_pattern": r.chain_pattern,
+                }
+                for r in rows
+            ], next_cursor
+
+    items, next_cursor = await run_in_db(_query)
+    return json_codec.JSONResponse(items, headers=cursor_headers(next_cursor))
@@ -12,17 +12,25 @@ These endpoints add *supplementary* context that enriches investigations:
 
 Prompt and response text is encrypted at rest when GOVERNOR_ENCRYPTION_KEY is set.
 """
-import json
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, desc
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, desc, func, insert, literal, null, or_, select, union_all
 
+from .. import json_codec
 from ..auth.dependencies import require_any, require_operator
-from ..database import db_session
-from ..encryption import encrypt_value, decrypt_value
+from ..database import db_session, run_in_db
+from ..encryption import decrypt_cached, encrypt_values
 from ..models import ConversationTurn, ActionLog, User
+from ..pagination import (
+    cursor_headers,
+    decode_timeline_cursor,
+    encode_timeline_cursor,
+    keyset_page,
+    split_page,
+)
 from ..schemas import (
     ConversationTurnCreate,
     ConversationTurnBatch,
@@ -32,13 +40,16 @@ from ..schemas import (
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+# Built once; handlers clone them with .where() per request
+_LIST_TURNS_BASE = select(ConversationTurn)
+
 
 # ---------------------------------------------------------------------------
 # Ingest a conversation turn
 # ---------------------------------------------------------------------------
 
 @router.post("/turns", status_code=201)
-def create_turn(
+async def create_turn(
     payload: ConversationTurnCreate,
     _user: User = Depends(require_operator),
 ) -> dict:
@@ -51,29 +62,34 @@ def create_turn(
     """
     now = datetime.now(timezone.utc)
 
-    with db_session() as session:
-        row = ConversationTurn(
-            conversation_id=payload.conversation_id,
-            turn_index=payload.turn_index or 0,
-            agent_id=payload.agent_id,
-            session_id=payload.session_id,
-            user_id=payload.user_id,
-            channel=payload.channel,
-            # Encrypt PII / sensitive text at rest
-            prompt_encrypted=encrypt_value(payload.prompt) if payload.prompt else None,
-            agent_reasoning_encrypted=encrypt_value(payload.agent_reasoning) if payload.agent_reasoning else None,
-            agent_response_encrypted=encrypt_value(payload.agent_response) if payload.agent_response else None,
-            tool_plan_json=json.dumps(payload.tool_plan) if payload.tool_plan else None,
-            model_id=payload.model_id,
-            prompt_tokens=payload.prompt_tokens,
-            completion_tokens=payload.completion_tokens,
-            created_at=now,
+    def _query() -> dict:
+        prompt_enc, reasoning_enc, response_enc = encrypt_values(
+            (payload.prompt, payload.agent_reasoning, payload.agent_response)
         )
-        session.add(row)
-        session.flush()
-        turn_id = row.id
+        with db_session() as session:
+            turn_id = session.scalar(
+                insert(ConversationTurn).values(
+                    conversation_id=payload.conversation_id,
+                    turn_index=payload.turn_index or 0,
+                    agent_id=payload.agent_id,
+                    session_id=payload.session_id,
+                    user_id=payload.user_id,
+                    channel=payload.channel,
+                    # Encrypt PII / sensitive text at rest
+                    prompt_encrypted=prompt_enc,
+                    agent_reasoning_encrypted=reasoning_enc,
+                    agent_response_encrypted=response_enc,
+                    tool_plan_json=json_codec.dumps(payload.tool_plan) if payload.tool_plan else None,
+                    model_id=payload.model_id,
+                    prompt_tokens=payload.prompt_tokens,
+                    completion_tokens=payload.completion_tokens,
+                    created_at=now,
+                ).returning(ConversationTurn.id)
+            )
 
-    return {"id": turn_id, "conversation_id": payload.conversation_id, "created_at": now.isoformat()}
+        return {"id": turn_id, "conversation_id": payload.conversation_id, "created_at": now.isoformat()}
+
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
@@ -81,68 +97,98 @@ def create_turn(
 # ---------------------------------------------------------------------------
 
 @router.post("/turns/batch", status_code=201)
-def create_turns_batch(
+async def create_turns_batch(
     payload: ConversationTurnBatch,
     _user: User = Depends(require_operator),
 ) -> dict:
     """Batch-ingest multiple conversation turns in one call."""
     now = datetime.now(timezone.utc)
-    ids: list[int] = []
-
-    with db_session() as session:
-        for t in payload.turns:
-            row = ConversationTurn(
-                conversation_id=t.conversation_id,
-                turn_index=t.turn_index or 0,
-                agent_id=t.agent_id,
-                session_id=t.session_id,
-                user_id=t.user_id,
-                channel=t.channel,
-                prompt_encrypted=encrypt_value(t.prompt) if t.prompt else None,
-                agent_reasoning_encrypted=encrypt_value(t.agent_reasoning) if t.agent_reasoning else None,
-                agent_response_encrypted=encrypt_value(t.agent_response) if t.agent_response else None,
-                tool_plan_json=json.dumps(t.tool_plan) if t.tool_plan else None,
-                model_id=t.model_id,
-                prompt_tokens=t.prompt_tokens,
-                completion_tokens=t.completion_tokens,
-                created_at=now,
-            )
-            session.add(row)
-            session.flush()
-            ids.append(row.id)
 
-    return {"created": len(ids), "ids": ids}
+    def _query() -> dict:
+        # Flat [prompt, reasoning, response, prompt, ...] so one pool pass covers the batch
+        encrypted = encrypt_values([
+            text
+            for t in payload.turns
+            for text in (t.prompt, t.agent_reasoning, t.agent_response)
+        ])
+        mappings = [
+            {
+                "conversation_id": t.conversation_id,
+                "turn_index": t.turn_index or 0,
+                "agent_id": t.agent_id,
+                "session_id": t.session_id,
+                "user_id": t.user_id,
+                "channel": t.channel,
+                "prompt_encrypted": encrypted[3 * i],
+                "agent_reasoning_encrypted": encrypted[3 * i + 1],
+                "agent_response_encrypted": encrypted[3 * i + 2],
+                "tool_plan_json": json_codec.dumps(t.tool_plan) if t.tool_plan else None,
+                "model_id": t.model_id,
+                "prompt_tokens": t.prompt_tokens,
+                "completion_tokens": t.completion_tokens,
+                "created_at": now,
+            }
+            for i, t in enumerate(payload.turns)
+        ]
+
+        # One multi-row INSERT ... RETURNING instead of a flush per turn
+        with db_session() as session:
+            ids = list(session.scalars(
+                insert(ConversationTurn).returning(
+                    ConversationTurn.id, sort_by_parameter_order=True,
+                ),
+                mappings,
+            ))
+
+        return {"created": len(ids), "ids": ids}
+
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
 # List / search turns
 # ---------------------------------------------------------------------------
 
-@router.get("/turns", response_model=List[ConversationTurnRead])
-def list_turns(
+@router.get(
+    "/turns",
+    response_model=None,
+    responses={200: {"model": List[ConversationTurnRead]}},
+)
+async def list_turns(
     conversation_id: Optional[str] = Query(None, description="Filter by conversation ID"),
     agent_id: Optional[str] = Query(None, description="Filter by agent ID"),
     session_id: Optional[str] = Query(None, description="Filter by session ID"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's X-Next-Cursor header"),
     _user: User = Depends(require_any),
-) -> list:
-    """List conversation turns with optional filters. Text is decrypted on read."""
-    with db_session() as session:
-        stmt = select(ConversationTurn).order_by(desc(ConversationTurn.created_at))
-        if conversation_id:
-            stmt = stmt.where(ConversationTurn.conversation_id == conversation_id)
-        if agent_id:
-            stmt = stmt.where(ConversationTurn.agent_id == agent_id)
-        if session_id:
-            stmt = stmt.where(ConversationTurn.session_id == session_id)
-        if user_id:
-            stmt = stmt.where(ConversationTurn.user_id == user_id)
-        stmt = stmt.offset(offset).limit(limit)
-
-        rows = session.execute(stmt).scalars().all()
-        return [_turn_to_read(r) for r in rows]
+) -> json_codec.JSONResponse:
+    """List conversation turns with optional filters. Text is decrypted on read.
+
+    Rows are trusted DB data in the ``ConversationTurnRead`` shape, so they
+    are serialised straight to JSON without a Pydantic validation pass.
+    """
+    def _query() -> tuple[list[dict], Optional[str]]:
+        with db_session() as session:
+            stmt = _LIST_TURNS_BASE
+            if conversation_id:
+                stmt = stmt.where(ConversationTurn.conversation_id == conversation_id)
+            if agent_id:
+                stmt = stmt.where(ConversationTurn.agent_id == agent_id)
+            if session_id:
+                stmt = stmt.where(ConversationTurn.session_id == session_id)
+            if user_id:
+                stmt = stmt.where(ConversationTurn.user_id == user_id)
+            stmt = keyset_page(stmt, ConversationTurn.created_at, ConversationTurn.id, cursor, limit)
+            if offset and not cursor:
+                stmt = stmt.offset(offset)
+
+            rows, next_cursor = split_page(session.execute(stmt).scalars().all(), limit)
+            return [_turn_to_dict(r) for r in rows], next_cursor
+
+    items, next_cursor = await run_in_db(_query)
+    return json_codec.JSONResponse(items, headers=cursor_headers(next_cursor))
 
 
 # ---------------------------------------------------------------------------
@@ -150,16 +196,19 @@ def list_turns(
 # ---------------------------------------------------------------------------
 
 @router.get("/turns/{turn_id}", response_model=ConversationTurnRead)
-def get_turn(
+async def get_turn(
     turn_id: int,
     _user: User = Depends(require_any),
 ) -> dict:
     """Get a single conversation turn by ID."""
-    with db_session() as session:
-        row = session.get(ConversationTurn, turn_id)
-        if not row:
-            raise HTTPException(404, "Turn not found")
-        return _turn_to_read(row)
+    def _query() -> dict:
+        with db_session() as session:
+            row = session.get(ConversationTurn, turn_id)
+            if not row:
+                raise HTTPException(404, "Turn not found")
+            return _turn_to_dict(row)
+
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
@@ -167,83 +216,140 @@ def get_turn(
 # ---------------------------------------------------------------------------
 
 @router.get("/{conversation_id}/timeline")
-def conversation_timeline(
+async def conversation_timeline(
     conversation_id: str,
+    limit: int = Query(1000, ge=1, le=5000, description="Maximum timeline entries per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
     _user: User = Depends(require_any),
-) -> dict:
+) -> StreamingResponse:
     """Return a chronological timeline of conversation turns and governed actions
     for a conversation, interleaved by timestamp.
 
     This is the key forensic view — shows exactly:
       User said X → Agent planned Y → Governor evaluated Z → Agent responded W
+
+    ``turns`` / ``actions`` are conversation totals. A timeline longer than
+    ``limit`` is paged: ``truncated`` is true and ``next_cursor`` (also sent
+    as ``X-Next-Cursor``) fetches the following entries.
     """
-    with db_session() as session:
-        # Get turns
-        turns = (
-            session.execute(
-                select(ConversationTurn)
-                .where(ConversationTurn.conversation_id == conversation_id)
-                .order_by(ConversationTurn.created_at)
-            )
-            .scalars()
-            .all()
-        )
+    # Turns and related actions merged in SQL — each side walks its
+    # (conversation_id, created_at) index, only the rendered columns are
+    # fetched, and the window is applied before anything is decrypted.
+    turns = select(
+        literal("turn").label("type"),
+        ConversationTurn.id,
+        ConversationTurn.created_at,
+        ConversationTurn.turn_index,
+        ConversationTurn.prompt_encrypted,
+        ConversationTurn.agent_reasoning_encrypted,
+        ConversationTurn.agent_response_encrypted,
+        ConversationTurn.tool_plan_json,
+        ConversationTurn.model_id,
+        null().label("tool"),
+        null().label("decision"),
+        null().label("risk_score"),
+        null().label("explanation"),
+        null().label("agent_id"),
+    ).where(ConversationTurn.conversation_id == conversation_id)
+    actions = select(
+        literal("action"),
+        ActionLog.id,
+        ActionLog.created_at,
+        null(),
+        null(),
+        null(),
+        null(),
+        null(),
+        null(),
+        ActionLog.tool,
+        ActionLog.decision,
+        ActionLog.risk_score,
+        ActionLog.explanation,
+        ActionLog.agent_id,
+    ).where(ActionLog.conversation_id == conversation_id)
+    merged = union_all(turns, actions).subquery()
+    # Turns sort before actions at the same instant; ids break remaining ties
+    stmt = select(merged)
+    if cursor:
+        created_at, kind, row_id = decode_timeline_cursor(cursor)
+        stmt = stmt.where(or_(
+            merged.c.created_at > created_at,
+            and_(merged.c.created_at == created_at, merged.c.type < kind),
+            and_(merged.c.created_at == created_at, merged.c.type == kind, merged.c.id > row_id),
+        ))
+    stmt = stmt.order_by(merged.c.created_at, merged.c.type.desc(), merged.c.id).limit(limit + 1)
+    turn_total = select(func.count()).select_from(ConversationTurn).where(
+        ConversationTurn.conversation_id == conversation_id
+    )
+    action_total = select(func.count()).select_from(ActionLog).where(
+        ActionLog.conversation_id == conversation_id
+    )
 
-        # Get related actions — match by conversation_id stored on ActionLog
-        actions = (
-            session.execute(
-                select(ActionLog)
-                .where(ActionLog.conversation_id == conversation_id)
-                .order_by(ActionLog.created_at)
+    def _query() -> tuple:
+        with db_session() as session:
+            return (
+                session.execute(stmt).all(),
+                session.execute(turn_total).scalar_one(),
+                session.execute(action_total).scalar_one(),
             )
-            .scalars()
-            .all()
-        )
 
-        timeline: list[dict] = []
+    rows, turn_count, action_count = await run_in_db(_query)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_timeline_cursor(last.created_at, last.type, last.id)
 
-        for t in turns:
-            timeline.append({
+    def _entry(r) -> dict:
+        if r.type == "turn":
+            return {
                 "type": "turn",
-                "timestamp": t.created_at.isoformat() if t.created_at else None,
-                "turn_id": t.id,
-                "turn_index": t.turn_index,
-                "prompt": decrypt_value(t.prompt_encrypted) if t.prompt_encrypted else None,
-                "agent_reasoning": decrypt_value(t.agent_reasoning_encrypted) if t.agent_reasoning_encrypted else None,
-                "agent_response": decrypt_value(t.agent_response_encrypted) if t.agent_response_encrypted else None,
-                "tool_plan": json.loads(t.tool_plan_json) if t.tool_plan_json else None,
-                "model_id": t.model_id,
-            })
-
-        for a in actions:
-            timeline.append({
-                "type": "action",
-                "timestamp": a.created_at.isoformat() if a.created_at else None,
-                "action_id": a.id,
-                "tool": a.tool,
-                "decision": a.decision,
-                "risk_score": a.risk_score,
-                "explanation": a.explanation,
-                "agent_id": a.agent_id,
-            })
-
-        # Sort by timestamp
-        timeline.sort(key=lambda e: e.get("timestamp") or "")
-
+                "timestamp": r.created_at.isoformat() if r.created_at else None,
+                "turn_id": r.id,
+                "turn_index": r.turn_index,
+                "prompt": decrypt_cached(r.prompt_encrypted) if r.prompt_encrypted else None,
+                "agent_reasoning": decrypt_cached(r.agent_reasoning_encrypted) if r.agent_reasoning_encrypted else None,
+                "agent_response": decrypt_cached(r.agent_response_encrypted) if r.agent_response_encrypted else None,
+                "tool_plan": json_codec.loads(r.tool_plan_json) if r.tool_plan_json else None,
+                "model_id": r.model_id,
+            }
         return {
-            "conversation_id": conversation_id,
-            "turns": len(turns),
-            "actions": len(actions),
-            "timeline": timeline,
+            "type": "action",
+            "timestamp": r.created_at.isoformat() if r.created_at else None,
+            "action_id": r.id,
+            "tool": r.tool,
+            "decision": r.decision,
+            "risk_score": r.risk_score,
+            "explanation": r.explanation,
+            "agent_id": r.agent_id,
         }
 
+    def _stream() -> Iterator[bytes]:
+        # Entries are decrypted and encoded one at a time, so long timelines
+        # start flowing immediately and never sit in memory as one document.
+        # The paging fields lead the document, so a streaming reader knows a
+        # page is partial before it consumes a single entry.
+        head = json_codec.dumps_bytes({
+            "conversation_id": conversation_id,
+            "turns": turn_count,
+            "actions": action_count,
+            "truncated": next_cursor is not None,
+            "next_cursor": next_cursor,
+        })
+        yield head[:-1] + b',"timeline":['
+        for i, r in enumerate(rows):
+            yield (b"," if i else b"") + json_codec.dumps_bytes(_entry(r))
+        yield b"]}"
+
+    return StreamingResponse(_stream(), media_type="application/json", headers=cursor_headers(next_cursor))
+
 
 # ---------------------------------------------------------------------------
 # Conversation list (grouped)
 # ---------------------------------------------------------------------------
 
 @router.get("", response_model=List[ConversationSummary])
-def list_conversations(
+async def list_conversations(
     agent_id: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=200),
@@ -251,79 +357,89 @@ def list_conversations(
     _user: User = Depends(require_any),
 ) -> list:
     """List distinct conversations with turn counts and time range."""
-    with db_session() as session:
-        stmt = (
-            select(
-                ConversationTurn.conversation_id,
-                ConversationTurn.agent_id,
-                ConversationTurn.user_id,
-                ConversationTurn.session_id,
-                func.count(ConversationTurn.id).label("turn_count"),
-                func.min(ConversationTurn.created_at).label("first_turn_at"),
-                func.max(ConversationTurn.created_at).label("last_turn_at"),
+    def _query() -> list:
+        with db_session() as session:
+            stmt = (
+                select(
+                    ConversationTurn.conversation_id,
+                    ConversationTurn.agent_id,
+                    ConversationTurn.user_id,
+                    ConversationTurn.session_id,
+                    func.count(ConversationTurn.id).label("turn_count"),
+                    func.min(ConversationTurn.created_at).label("first_turn_at"),
+                    func.max(ConversationTurn.created_at).label("last_turn_at"),
+                )
+                .group_by(
+                    ConversationTurn.conversation_id,
+                    ConversationTurn.agent_id,
+                    ConversationTurn.user_id,
+                    ConversationTurn.session_id,
+                )
+                .order_by(desc("last_turn_at"))
             )
-            .group_by(
-                ConversationTurn.conversation_id,
-                ConversationTurn.agent_id,
-                ConversationTurn.user_id,
-                ConversationTurn.session_id,
+            if agent_id:
+                stmt = stmt.where(ConversationTurn.agent_id == agent_id)
+            if user_id:
+                stmt = stmt.where(ConversationTurn.user_id == user_id)
+            page = stmt.offset(offset).limit(limit).cte("page")
+
+            # Governed actions per conversation, joined in one round-trip
+            action_counts = (
+                select(
+                    ActionLog.conversation_id,
+                    func.count(ActionLog.id).label("action_count"),
+                )
+                .where(ActionLog.conversation_id.in_(select(page.c.conversation_id)))
+                .group_by(ActionLog.conversation_id)
+                .subquery()
             )
-            .order_by(desc("last_turn_at"))
-        )
-        if agent_id:
-            stmt = stmt.where(ConversationTurn.agent_id == agent_id)
-        if user_id:
-            stmt = stmt.where(ConversationTurn.user_id == user_id)
-        stmt = stmt.offset(offset).limit(limit)
-
-        rows = session.execute(stmt).all()
-
-        # Count governed actions per conversation
-        result = []
-        for r in rows:
-            action_count = session.scalar(
-                select(func.count(ActionLog.id))
-                .where(ActionLog.conversation_id == r.conversation_id)
-            ) or 0
-
-            result.append(
+            rows = session.execute(
+                select(page, func.coalesce(action_counts.c.action_count, 0).label("action_count"))
+                .outerjoin(action_counts, action_counts.c.conversation_id == page.c.conversation_id)
+                .order_by(page.c.last_turn_at.desc())
+            ).all()
+
+            result = [
                 ConversationSummary(
                     conversation_id=r.conversation_id,
                     agent_id=r.agent_id,
                     user_id=r.user_id,
                     session_id=r.session_id,
                     turn_count=r.turn_count,
-                    action_count=action_count,
+                    action_count=r.action_count,
                     first_turn_at=r.first_turn_at,
                     last_turn_at=r.last_turn_at,
                 )
-            )
-        return result
+                for r in rows
+            ]
+            return result
+
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _turn_to_read(row: ConversationTurn) -> ConversationTurnRead:
-    """Convert a DB row to a read schema, decrypting text fields."""
-    return ConversationTurnRead(
-        id=row.id,
-        conversation_id=row.conversation_id,
-        turn_index=row.turn_index,
-        agent_id=row.agent_id,
-        session_id=row.session_id,
-        user_id=row.user_id,
-        channel=row.channel,
-        prompt=decrypt_value(row.prompt_encrypted) if row.prompt_encrypted else None,
-        agent_reasoning=decrypt_value(row.agent_reasoning_encrypted) if row.agent_reasoning_encrypted else None,
-        agent_response=decrypt_value(row.agent_response_encrypted) if row.agent_response_encrypted else None,
-        tool_plan=json.loads(row.tool_plan_json) if row.tool_plan_json else None,
-        model_id=row.model_id,
-        prompt_tokens=row.prompt_tokens,
-        completion_tokens=row.completion_tokens,
-        created_at=row.created_at,
-    )
+def _turn_to_dict(row: ConversationTurn) -> dict:
+    """Convert a DB row to the ``ConversationTurnRead`` shape, decrypting text fields."""
+    return {
+        "id": row.id,
+        "conversation_id": row.conversation_id,
+        "turn_index": row.turn_index,
+        "agent_id": row.agent_id,
+        "session_id": row.session_id,
+        "user_id": row.user_id,
+        "channel": row.channel,
+        "prompt": decrypt_cached(row.prompt_encrypted) if row.prompt_encrypted else None,
+        "agent_reasoning": decrypt_cached(row.agent_reasoning_encrypted) if row.agent_reasoning_encrypted else None,
+        "agent_response": decrypt_cached(row.agent_response_encrypted) if row.agent_response_encrypted else None,
+        "tool_plan": json_codec.loads(row.tool_plan_json) if row.tool_plan_json else None,
+        "model_id": row.model_id,
+        "prompt_tokens": row.prompt_tokens,
+        "completion_tokens": row.completion_tokens,
+        "created_at": row.created_at,
+    }
 
 
 
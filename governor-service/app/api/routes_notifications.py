@@ -7,17 +7,24 @@ Jira, webhook) that receive alerts on governance events.
 """
 from __future__ import annotations
 
-import json
-from typing import List
+from typing import List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
+from .. import json_codec
 from ..auth.dependencies import require_any, require_operator
-from ..database import db_session
-from ..encryption import encrypt_value, decrypt_value
+from ..database import db_session, run_in_db
+from ..encryption import encrypt_value
 from ..escalation.models import NotificationChannel
-from ..escalation.channels import test_notification_channel
+from ..escalation.channels import (
+    cache_channel_read,
+    cached_channel_read,
+    channel_cache_generation,
+    decode_channel_config,
+    invalidate_channel_cache,
+    test_notification_channel,
+)
 from ..schemas import (
     NotificationChannelCreate,
     NotificationChannelRead,
@@ -26,17 +33,15 @@ from ..schemas import (
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+_LIST_CHANNELS = select(NotificationChannel).order_by(NotificationChannel.created_at.desc())
+
 
 def _row_to_read(ch: NotificationChannel) -> NotificationChannelRead:
-    raw = ch.config_json
-    if isinstance(raw, str):
-        raw = decrypt_value(raw)
-        raw = json.loads(raw)
     return NotificationChannelRead(
         id=ch.id,
         label=ch.label,
         channel_type=ch.channel_type,
-        config_json=raw,
+        config_json=decode_channel_config(ch.config_json),
         on_block=ch.on_block,
         on_review=ch.on_review,
         on_auto_ks=ch.on_auto_ks,
@@ -53,95 +58,129 @@ def _row_to_read(ch: NotificationChannel) -> NotificationChannelRead:
 # ---------------------------------------------------------------------------
 
 @router.get("", response_model=List[NotificationChannelRead])
-def list_channels(
+async def list_channels(
     _user=Depends(require_any),
 ) -> List[NotificationChannelRead]:
     """List all notification channels."""
-    with db_session() as session:
-        rows = session.execute(
-            select(NotificationChannel).order_by(NotificationChannel.created_at.desc())
-        ).scalars().all()
-        return [_row_to_read(ch) for ch in rows]
+    def _query() -> List[NotificationChannelRead]:
+        with db_session() as session:
+            rows = session.execute(_LIST_CHANNELS).scalars().all()
+            return [_row_to_read(ch) for ch in rows]
+
+    return await run_in_db(_query)
 
 
 @router.post("", response_model=NotificationChannelRead, status_code=201)
-def create_channel(
+async def create_channel(
     payload: NotificationChannelCreate,
     _user=Depends(require_operator),
 ) -> NotificationChannelRead:
     """Register a new notification channel."""
-    with db_session() as session:
-        ch = NotificationChannel(
-            label=payload.label,
-            channel_type=payload.channel_type,
-            config_json=encrypt_value(json.dumps(payload.config_json)),
-            on_block=payload.on_block,
-            on_review=payload.on_review,
-            on_auto_ks=payload.on_auto_ks,
-            on_policy_change=payload.on_policy_change,
-        )
-        session.add(ch)
-        session.flush()
-        return _row_to_read(ch)
+    def _query() -> NotificationChannelRead:
+        with db_session() as session:
+            # INSERT ... RETURNING hands back the row (defaults included) in one statement
+            ch = session.scalar(
+                insert(NotificationChannel).values(
+                    label=payload.label,
+                    channel_type=payload.channel_type,
+                    config_json=encrypt_value(json_codec.dumps(payload.config_json)),
+                    on_block=payload.on_block,
+                    on_review=payload.on_review,
+                    on_auto_ks=payload.on_auto_ks,
+                    on_policy_change=payload.on_policy_change,
+                ).returning(NotificationChannel)
+            )
+            return _row_to_read(ch)
+
+    return await run_in_db(_query)
 
 
 @router.get("/{channel_id}", response_model=NotificationChannelRead)
-def get_channel(
+async def get_channel(
     channel_id: int,
     _user=Depends(require_any),
 ) -> NotificationChannelRead:
     """Get a single notification channel by ID."""
-    with db_session() as session:
-        ch = session.get(NotificationChannel, channel_id)
-        if not ch:
-            raise HTTPException(status_code=404, detail="Channel not found.")
-        return _row_to_read(ch)
+    cached = cached_channel_read(channel_id)
+    if cached is not None:
+        return cached
+    gen = channel_cache_generation()
+
+    def _query() -> NotificationChannelRead:
+        with db_session() as session:
+            ch = session.get(NotificationChannel, channel_id)
+            if not ch:
+                raise HTTPException(status_code=404, detail="Channel not found.")
+            return cache_channel_read(_row_to_read(ch), gen)
+
+    return await run_in_db(_query)
 
 
 @router.patch("/{channel_id}", response_model=NotificationChannelRead)
-def update_channel(
+async def update_channel(
     channel_id: int,
     payload: NotificationChannelUpdate,
     _user=Depends(require_operator),
 ) -> NotificationChannelRead:
     """Update a notification channel configuration."""
-    with db_session() as session:
-        ch = session.get(NotificationChannel, channel_id)
-        if not ch:
-            raise HTTPException(status_code=404, detail="Channel not found.")
+    def _query() -> Tuple[NotificationChannelRead, bool]:
+        with db_session() as session:
+            ch = session.get(NotificationChannel, channel_id)
+            if not ch:
+                raise HTTPException(status_code=404, detail="Channel not found.")
+
+            changes = payload.model_dump(exclude_unset=True)
+            if not changes:
+                raise HTTPException(status_code=400, detail="No fields to update.")
 
-        changes = payload.model_dump(exclude_unset=True)
-        if not changes:
-            raise HTTPException(status_code=400, detail="No fields to update.")
+            # Admin UI saves usually echo the current config back — only
+            # re-encrypt (and write) fields whose value actually changed.
+            if "config_json" in changes and changes["config_json"] == decode_channel_config(ch.config_json):
+                del changes["config_json"]
+            changes = {f: v for f, v in changes.items() if f == "config_json" or getattr(ch, f) != v}
+            if not changes:
+                return _row_to_read(ch), False
 
-        if "config_json" in changes:
-            changes["config_json"] = encrypt_value(json.dumps(changes["config_json"]))
+            if "config_json" in changes:
+                changes["config_json"] = encrypt_value(json_codec.dumps(changes["config_json"]))
 
-        for field, value in changes.items():
-            setattr(ch, field, value)
+            for field, value in changes.items():
+                setattr(ch, field, value)
 
-        session.flush()
-        return _row_to_read(ch)
+            session.flush()
+            return _row_to_read(ch), True
+
+    read, changed = await run_in_db(_query)
+    if changed:
+        invalidate_channel_cache(channel_id)  # after commit, so no stale re-fill
+    return read
 
 
 @router.delete("/{channel_id}")
-def delete_channel(
+async def delete_channel(
     channel_id: int,
     _user=Depends(require_operator),
 ) -> dict:
     """Delete a notification channel."""
-    with db_session() as session:
-        ch = session.get(NotificationChannel, channel_id)
-        if not ch:
-            raise HTTPException(status_code=404, detail="Channel not found.")
-        session.delete(ch)
-        return {"status": "deleted", "channel_id": channel_id}
+    def _query() -> dict:
+        with db_session() as session:
+            ch = session.get(NotificationChannel, channel_id)
+            if not ch:
+                raise HTTPException(status_code=404, detail="Channel not found.")
+            session.delete(ch)
+            return {"status": "deleted", "channel_id": channel_id}
+
+    result = await run_in_db(_query)
+    invalidate_channel_cache(channel_id)
+    return result
 
 
 @router.post("/{channel_id}/test")
-def test_channel(
+async def test_channel(
     channel_id: int,
     _user=Depends(require_operator),
 ) -> dict:
     """Send a test notification through a channel to verify configuration."""
-    return test_notification_channel(channel_id)
+    result = await run_in_db(test_notification_channel, channel_id)
+    invalidate_channel_cache(channel_id)  # last_sent_at may have moved
+    return result
@@ -1,53 +1,153 @@
 from __future__ import annotations
 
-import json
 import re
-from datetime import datetime, timezone
-from typing import List, Optional
+import string
+from typing import Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, insert, literal, select, update
 
+from .. import json_codec
 from ..auth.dependencies import require_any, require_operator
-from ..database import db_session
+from ..database import db_session, run_in_db
 from ..models import PolicyModel, PolicyAuditLog, PolicyVersion, User
-from ..policies.loader import invalidate_policy_cache
+from ..policies.loader import (
+    compile_regex, decode_match_json, invalidate_policy_cache_on_commit, regex_flags,
+)
 from ..schemas import (
     PolicyCreate, PolicyRead, PolicyUpdate, PolicyAuditRead, PolicyVersionRead,
 )
 
-router = APIRouter(prefix="/policies", tags=["policies"])
+router = APIRouter(
+    prefix="/policies", tags=["policies"], default_response_class=json_codec.JSONResponse,
+)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Strings made only of these characters are always valid regexes
+_LITERAL_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "._-/: ")
+
+
+def _check_pattern(pattern: str, flags: int = 0) -> None:
+    """Raise ``re.error`` if ``pattern`` is not a valid regex.
+
+    Plain literals (the common case) are accepted without compiling; anything
+    else is compiled into the evaluator's regex cache.
+    """
+    if isinstance(pattern, str) and _LITERAL_SAFE_CHARS.issuperset(pattern):
+        return
+    compile_regex(pattern, flags)
+
+
+# Checked in this order, so the reported key is stable when both are bad
+_REGEX_KEYS = ("url_regex", "args_regex")
+
+
+def _first_regex_error(match_json: dict) -> Optional[tuple[str, re.error]]:
+    """The first regex field in ``match_json`` that fails to compile, with its error."""
+    patterns = [(key, p) for key in _REGEX_KEYS if (p := match_json.get(key))]
+    if not patterns:
+        return None  # the common case: no regex constraints at all
+    flags = regex_flags(match_json)
+    for key, pattern in patterns:
+        try:
+            _check_pattern(pattern, flags)
+        except re.error as exc:
+            return key, exc
+    return None
+
+
 def _validate_regex_fields(match_json: dict) -> None:
     """Validate that regex patterns in match_json compile without error."""
-    for key in ("url_regex", "args_regex"):
-        pattern = match_json.get(key)
-        if pattern:
-            try:
-                re.compile(pattern)
-            except re.error as exc:
-                raise HTTPException(
-                    status_code=422,
-                    detail=f"Invalid regex in '{key}': {exc}",
-                )
+    if error := _first_regex_error(match_json):
+        key, exc = error
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid regex in '{key}': {exc}",
+        )
+
+
+_EXPORT_BATCH = 256
+
+# Just the PolicyRead columns, as plain rows — list/export skip ORM hydration
+_SELECT_POLICY_COLUMNS = select(
+    PolicyModel.policy_id,
+    PolicyModel.description,
+    PolicyModel.severity,
+    PolicyModel.match_json,
+    PolicyModel.action,
+    PolicyModel.is_active,
+    PolicyModel.version,
+    PolicyModel.created_at,
+    PolicyModel.updated_at,
+)
+
+
+if json_codec.raw is json_codec.loads:
+    # No splicing available — the memoised decode is the cheaper parse
+    _spliced_match = decode_match_json
+else:
+    def _spliced_match(raw: Optional[str]):
+        """Stored ``match_json``, embedded by ``json_codec`` without a parse/re-encode."""
+        return json_codec.raw(raw) if raw else {}
+
+
+def _row_to_dict(r: PolicyModel, *, splice: bool = False) -> dict:
+    """A policy row in the ``PolicyRead`` shape, for responses that skip validation.
+
+    ``splice`` embeds ``match_json`` as stored text; only for bodies that
+    go straight to ``json_codec``.
+    """
+    return {
+        "policy_id": r.policy_id,
+        "description": r.description,
+        "severity": r.severity,
+        "match_json": _spliced_match(r.match_json) if splice else decode_match_json(r.match_json),
+        "action": r.action,
+        "is_active": r.is_active,
+        "version": getattr(r, "version", 1) or 1,
+        "created_at": r.created_at,
+        "updated_at": r.updated_at,
+    }
 
 
 def _row_to_read(r: PolicyModel) -> PolicyRead:
-    return PolicyRead(
-        policy_id=r.policy_id,
-        description=r.description,
-        severity=r.severity,
-        match_json=json.loads(r.match_json or "{}"),
-        action=r.action,
-        is_active=r.is_active,
-        version=getattr(r, "version", 1) or 1,
-        created_at=r.created_at,
-        updated_at=r.updated_at,
+    """Built with ``model_construct`` — the values come straight from the DB,
+    and the response model validates once on the way out anyway."""
+    return PolicyRead.model_construct(**_row_to_dict(r))
+
+
+def _policy_exists(session, policy_id: str) -> bool:
+    """Existence check that fetches no row data."""
+    return session.execute(
+        select(literal(1)).where(PolicyModel.policy_id == policy_id).limit(1)
+    ).first() is not None
+
+
+def _get_policy_or_404(session, policy_id: str) -> PolicyModel:
+    row = session.execute(
+        select(PolicyModel).where(PolicyModel.policy_id == policy_id)
+    ).scalar_one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Policy not found.")
+    return row
+
+
+def _set_active(session, policy_id: str, active: bool) -> Optional[PolicyModel]:
+    """Set ``is_active`` with one ``UPDATE ... RETURNING``.
+
+    Returns the updated row, or None when nothing changed — the policy is
+    missing or already in that state.
+    """
+    return session.scalar(
+        update(PolicyModel)
+        .where(PolicyModel.policy_id == policy_id, PolicyModel.is_active == (not active))
+        .values(is_active=active)
+        .returning(PolicyModel)
     )
 
 
@@ -82,90 +182,171 @@ def _log_policy_audit(
     changes: dict | None = None,
     note: str | None = None,
 ) -> None:
-    """Write an immutable audit trail entry for a policy mutation."""
-    entry = PolicyAuditLog(
-        action=action,
-        policy_id=policy_id,
-        username=user.username,
-        user_role=user.role,
-        changes_json=json.dumps(changes) if changes else None,
-        note=note,
-    )
-    session.add(entry)
+    """Write an immutable audit trail entry for a policy mutation.
+
+    The entry joins the caller's transaction, so it commits — or rolls
+    back — with the change it records, at no extra commit cost.
+    """
+    session.add(PolicyAuditLog(**_audit_values(action, policy_id, user, changes, note)))
+
+
+def _audit_values(
+    action: str,
+    policy_id: str,
+    user: User,
+    changes: dict | None = None,
+    note: str | None = None,
+) -> dict:
+    """Column values for one audit entry — bulk paths insert these in a single statement."""
+    return {
+        "action": action,
+        "policy_id": policy_id,
+        "username": user.username,
+        "user_role": user.role,
+        "changes_json": json_codec.dumps(changes) if changes else None,
+        "note": note,
+    }
 
 
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=List[PolicyRead])
-def list_policies(
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": List[PolicyRead]}},
+)
+async def list_policies(
     active_only: bool = Query(False, description="If true, return only active policies."),
     _user: User = Depends(require_any),
-) -> List[PolicyRead]:
-    """List all dynamic (DB-stored) policies."""
-    with db_session() as session:
-        stmt = select(PolicyModel)
-        if active_only:
-            stmt = stmt.where(PolicyModel.is_active == True)  # noqa: E712
-        rows = session.execute(stmt).scalars().all()
-        return [_row_to_read(r) for r in rows]
+) -> json_codec.JSONResponse:
+    """List all dynamic (DB-stored) policies.
+
+    Rows are serialised straight from the DB without a Pydantic pass.
+    """
+    def _query() -> list[dict]:
+        with db_session() as session:
+            stmt = _SELECT_POLICY_COLUMNS
+            if active_only:
+                stmt = stmt.where(PolicyModel.is_active == True)  # noqa: E712
+            return [_row_to_dict(r, splice=True) for r in session.execute(stmt)]
+
+    return json_codec.JSONResponse(await run_in_db(_query))
 
 
 # ---------------------------------------------------------------------------
 # Bulk import / export / template — MUST come before /{policy_id} routes
 # ---------------------------------------------------------------------------
 
-@router.get("/export/all", response_model=List[PolicyRead])
+@router.get(
+    "/export/all",
+    response_model=None,
+    responses={200: {"model": List[PolicyRead]}},
+)
 def export_policies(
     _user: User = Depends(require_any),
-) -> List[PolicyRead]:
-    """Export all dynamic policies as JSON (for backup / transfer)."""
-    with db_session() as session:
-        rows = session.execute(select(PolicyModel)).scalars().all()
-        return [_row_to_read(r) for r in rows]
+) -> StreamingResponse:
+    """Export all dynamic policies as JSON (for backup / transfer).
+
+    Streamed from a server-side cursor in batches of ``_EXPORT_BATCH`` rows,
+    so memory stays flat however many policies there are. Rows are
+    serialised straight from the DB without a Pydantic pass.
+    """
+    def _stream() -> Iterator[bytes]:
+        with db_session() as session:
+            result = session.execute(
+                _SELECT_POLICY_COLUMNS.execution_options(yield_per=_EXPORT_BATCH)
+            )
+            yield b"["
+            sep = b""
+            for batch in result.partitions():
+                yield sep + b",".join(json_codec.dumps_bytes(_row_to_dict(r, splice=True)) for r in batch)
+                sep = b","
+            yield b"]"
+
+    return StreamingResponse(_stream(), media_type="application/json")
+
+
+# Static, so encoded once at import rather than on every download
+_TEMPLATE_BYTES = json_codec.dumps_bytes({
+    "description": "OpenClaw Governor — Policy Import Template",
+    "instructions": (
+        "Fill in the 'policies' array below. Each policy needs: "
+        "policy_id (unique string), description, severity (0-100), "
+        "action ('allow'|'block'|'review'), and match_json (matching rules). "
+        "Upload this file via POST /policies/import."
+    ),
+    "policies": [
+        {
+            "policy_id": "example-block-curl",
+            "description": "Block shell commands containing curl to external hosts",
+            "severity": 80,
+            "action": "block",
+            "match_json": {
+                "tool": "shell",
+                "args_regex": "(curl|wget)\\s+https?://(?!localhost)"
+            },
+        },
+        {
+            "policy_id": "example-review-file-write",
+            "description": "Review file write operations to sensitive paths",
+            "severity": 60,
+            "action": "review",
+            "match_json": {
+                "tool": "file_write",
+                "args_regex": "(/etc/|/var/|~/.ssh/)"
+            },
+        },
+    ],
+})
 
 
 @router.get("/template")
-def download_template(
+async def download_template(
     _user: User = Depends(require_any),
-) -> dict:
+) -> Response:
     """Return a policy template that users can fill in and upload."""
+    return Response(content=_TEMPLATE_BYTES, media_type="application/json")
+
+
+_VALID_ACTIONS = frozenset(("allow", "block", "review"))
+
+
+def _validate_import_entry(p: dict, pid: str) -> tuple[Optional[dict], Optional[str]]:
+    """Check one bulk-import entry. Returns ``(insert_row, None)`` or ``(None, reason)``."""
+    action = p.get("action", "").strip()
+    if action not in _VALID_ACTIONS:
+        return None, f"Invalid action: '{action}'"
+
+    severity = p.get("severity")
+    try:
+        severity = int(severity)
+        if not (0 <= severity <= 100):
+            raise ValueError()
+    except (ValueError, TypeError):
+        return None, "Severity must be 0-100"
+
+    match_json = p.get("match_json", {})
+    if isinstance(match_json, dict):
+        if error := _first_regex_error(match_json):
+            key, exc = error
+            return None, f"Bad regex in {key}: {exc}"
+    else:
+        match_json = {}
+
     return {
-        "description": "OpenClaw Governor — Policy Import Template",
-        "instructions": (
-            "Fill in the 'policies' array below. Each policy needs: "
-            "policy_id (unique string), description, severity (0-100), "
-            "action ('allow'|'block'|'review'), and match_json (matching rules). "
-            "Upload this file via POST /policies/import."
-        ),
-        "policies": [
-            {
-                "policy_id": "example-block-curl",
-                "description": "Block shell commands containing curl to external hosts",
-                "severity": 80,
-                "action": "block",
-                "match_json": {
-                    "tool": "shell",
-                    "args_regex": "(curl|wget)\\s+https?://(?!localhost)"
-                },
-            },
-            {
-                "policy_id": "example-review-file-write",
-                "description": "Review file write operations to sensitive paths",
-                "severity": 60,
-                "action": "review",
-                "match_json": {
-                    "tool": "file_write",
-                    "args_regex": "(/etc/|/var/|~/.ssh/)"
-                },
-            },
-        ],
-    }
+        "policy_id": pid,
+        "description": p.get("description", pid),
+        "severity": severity,
+        "match_json": json_codec.dumps(match_json),
+        "action": action,
+        "is_active": p.get("is_active", True),
+    }, None
 
 
 @router.post("/import", response_model=dict, status_code=201)
-def import_policies(
+async def import_policies(
     payload: dict,
     user: User = Depends(require_operator),
 ) -> dict:
@@ -179,150 +360,139 @@ def import_policies(
     if not isinstance(policies, list):
         raise HTTPException(status_code=422, detail="Expected 'policies' array in body.")
 
-    created = 0
-    skipped = 0
-    failed = []
+    def _query() -> dict:
+        created = 0
+        skipped = 0
+        failed = []
+        to_insert: list[dict] = []
+        audit_rows: list[dict] = []
 
-    with db_session() as session:
-        for i, p in enumerate(policies):
+        # Validation is pure CPU — finish it before a connection is checked out
+        entries = []
+        for p in policies:
             pid = p.get("policy_id", "").strip()
-            if not pid:
-                failed.append({"index": i, "reason": "Missing policy_id"})
-                continue
+            entries.append((pid, *_validate_import_entry(p, pid)) if pid else (pid, None, None))
+
+        with db_session() as session:
+            # One IN query for duplicates instead of a lookup per policy
+            ids = {pid for pid, _, _ in entries} - {""}
+            existing_ids = set(session.execute(
+                select(PolicyModel.policy_id).where(PolicyModel.policy_id.in_(ids))
+            ).scalars()) if ids else set()
+
+            for i, (pid, row, reason) in enumerate(entries):
+                if not pid:
+                    failed.append({"index": i, "reason": "Missing policy_id"})
+                    continue
 
-            # Check for duplicates
-            existing = session.execute(
-                select(PolicyModel).where(PolicyModel.policy_id == pid)
-            ).scalar_one_or_none()
-            if existing:
-                skipped += 1
-                continue
-
-            # Validate required fields
-            action = p.get("action", "").strip()
-            if action not in ("allow", "block", "review"):
-                failed.append({"index": i, "policy_id": pid, "reason": f"Invalid action: '{action}'"})
-                continue
-
-            severity = p.get("severity")
-            try:
-                severity = int(severity)
-                if not (0 <= severity <= 100):
-                    raise ValueError()
-            except (ValueError, TypeError):
-                failed.append({"index": i, "policy_id": pid, "reason": "Severity must be 0-100"})
-                continue
-
-            match_json = p.get("match_json", {})
-            if isinstance(match_json, dict):
-                # Validate regex fields
-                for key in ("url_regex", "args_regex"):
-                    pattern = match_json.get(key)
-                    if pattern:
-                        try:
-                            re.compile(pattern)
-                        except re.error as exc:
-                            failed.append({"index": i, "policy_id": pid, "reason": f"Bad regex in {key}: {exc}"})
-                            match_json = None
-                            break
-                if match_json is None:
+                # Check for duplicates (in the DB or earlier in this payload)
+                if pid in existing_ids:
+                    skipped += 1
                     continue
-            else:
-                match_json = {}
-
-            row = PolicyModel(
-                policy_id=pid,
-                description=p.get("description", pid),
-                severity=severity,
-                match_json=json.dumps(match_json),
-                action=action,
-                is_active=p.get("is_active", True),
-            )
-            session.add(row)
-            _log_policy_audit(
-                session, "import", pid, user,
-                changes={"severity": severity, "action": action},
-                note=f"Imported from bulk upload ({len(policies)} total in payload)",
-            )
-            created += 1
 
-        if created > 0:
-            invalidate_policy_cache()
+                if reason:
+                    failed.append({"index": i, "policy_id": pid, "reason": reason})
+                    continue
 
-    return {
-        "created": created,
-        "skipped": skipped,
-        "failed": failed,
-        "total_in_payload": len(policies),
-    }
+                to_insert.append(row)
+                existing_ids.add(pid)
+                audit_rows.append(_audit_values(
+                    "import", pid, user,
+                    changes={"severity": row["severity"], "action": row["action"]},
+                    note=f"Imported from bulk upload ({len(policies)} total in payload)",
+                ))
+                created += 1
+
+            if to_insert:
+                # One executemany INSERT per table for the whole upload
+                session.execute(insert(PolicyModel), to_insert)
+                session.execute(insert(PolicyAuditLog), audit_rows)
+                invalidate_policy_cache_on_commit(session)
+
+        return {
+            "created": created,
+            "skipped": skipped,
+            "failed": failed,
+            "total_in_payload": len(policies),
+        }
+
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
 # Policy audit trail — query endpoint (before /{policy_id} routes)
 # ---------------------------------------------------------------------------
 
-def _audit_to_read(row: PolicyAuditLog) -> PolicyAuditRead:
-    return PolicyAuditRead(
-        id=row.id,
-        created_at=row.created_at,
-        action=row.action,
-        policy_id=row.policy_id,
-        username=row.username,
-        user_role=row.user_role,
-        changes_json=json.loads(row.changes_json) if row.changes_json else None,
-        note=row.note,
-    )
+def _audit_to_dict(row: PolicyAuditLog) -> dict:
+    """An audit row in the ``PolicyAuditRead`` shape, for responses that skip validation."""
+    return {
+        "id": row.id,
+        "created_at": row.created_at,
+        "action": row.action,
+        "policy_id": row.policy_id,
+        "username": row.username,
+        "user_role": row.user_role,
+        # Already JSON text — spliced into the response without a parse/re-encode
+        "changes_json": json_codec.raw(row.changes_json) if row.changes_json else None,
+        "note": row.note,
+    }
 
 
-@router.get("/audit/trail", response_model=List[PolicyAuditRead])
-def list_policy_audit(
+@router.get(
+    "/audit/trail",
+    response_model=None,
+    responses={200: {"model": List[PolicyAuditRead]}},
+)
+async def list_policy_audit(
     policy_id: Optional[str] = Query(None, description="Filter by policy ID"),
     action: Optional[str] = Query(None, description="Filter: create|edit|archive|activate|delete|import|toggle|bulk_archive|bulk_activate|bulk_delete"),
     username: Optional[str] = Query(None, description="Filter by who made the change"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     _user: User = Depends(require_any),
-) -> List[PolicyAuditRead]:
+) -> json_codec.JSONResponse:
     """Query the immutable policy change audit trail."""
-    with db_session() as session:
-        stmt = select(PolicyAuditLog).order_by(PolicyAuditLog.created_at.desc())
-        if policy_id:
-            stmt = stmt.where(PolicyAuditLog.policy_id == policy_id)
-        if action:
-            stmt = stmt.where(PolicyAuditLog.action == action)
-        if username:
-            stmt = stmt.where(PolicyAuditLog.username == username)
-        stmt = stmt.offset(offset).limit(limit)
-        rows = session.execute(stmt).scalars().all()
-        return [_audit_to_read(r) for r in rows]
+    def _query() -> list[dict]:
+        with db_session() as session:
+            stmt = select(PolicyAuditLog).order_by(PolicyAuditLog.created_at.desc())
+            if policy_id:
+                stmt = stmt.where(PolicyAuditLog.policy_id == policy_id)
+            if action:
+                stmt = stmt.where(PolicyAuditLog.action == action)
+            if username:
+                stmt = stmt.where(PolicyAuditLog.username == username)
+            stmt = stmt.offset(offset).limit(limit)
+            rows = session.execute(stmt).scalars().all()
+            return [_audit_to_dict(r) for r in rows]
+
+    return json_codec.JSONResponse(await run_in_db(_query))
 
 
 @router.get("/audit/stats")
-def policy_audit_stats(
+async def policy_audit_stats(
     _user: User = Depends(require_any),
 ) -> dict:
     """Summary statistics for the policy audit trail."""
-    from sqlalchemy import func
-    with db_session() as session:
-        total = session.execute(
-            select(func.count(PolicyAuditLog.id))
-        ).scalar() or 0
-
-        def _count(col, val):
-            return session.execute(
-                select(func.count(PolicyAuditLog.id)).where(col == val)
-            ).scalar() or 0
-
-        return {
-            "total": total,
-            "creates": _count(PolicyAuditLog.action, "create"),
-            "edits": _count(PolicyAuditLog.action, "edit"),
-            "archives": _count(PolicyAuditLog.action, "archive"),
-            "activates": _count(PolicyAuditLog.action, "activate"),
-            "deletes": _count(PolicyAuditLog.action, "delete"),
-            "imports": _count(PolicyAuditLog.action, "import"),
-            "toggles": _count(PolicyAuditLog.action, "toggle"),
-        }
+    def _query() -> dict:
+        with db_session() as session:
+            # One grouped scan instead of a COUNT per action
+            counts = dict(session.execute(
+                select(PolicyAuditLog.action, func.count(PolicyAuditLog.id))
+                .group_by(PolicyAuditLog.action)
+            ).all())
+
+            return {
+                "total": sum(counts.values()),
+                "creates": counts.get("create", 0),
+                "edits": counts.get("edit", 0),
+                "archives": counts.get("archive", 0),
+                "activates": counts.get("activate", 0),
+                "deletes": counts.get("delete", 0),
+                "imports": counts.get("import", 0),
+                "toggles": counts.get("toggle", 0),
+            }
+
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
@@ -330,62 +500,64 @@ def policy_audit_stats(
 # ---------------------------------------------------------------------------
 
 @router.get("/{policy_id}", response_model=PolicyRead)
-def get_policy(
+async def get_policy(
     policy_id: str,
     _user: User = Depends(require_any),
 ) -> PolicyRead:
     """Get a single dynamic policy by ID."""
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-        return _row_to_read(row)
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            row = session.execute(
+                _SELECT_POLICY_COLUMNS.where(PolicyModel.policy_id == policy_id)
+            ).first()
+            if not row:
+                raise HTTPException(status_code=404, detail="Policy not found.")
+            return _row_to_read(row)
+
+    return await run_in_db(_query)
 
 
 @router.post("", response_model=PolicyRead, status_code=201)
-def create_policy(
+async def create_policy(
     payload: PolicyCreate,
     user: User = Depends(require_operator),
 ) -> PolicyRead:
     """Create a new dynamic policy. Requires operator or admin."""
     _validate_regex_fields(payload.match_json)
 
-    with db_session() as session:
-        existing = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == payload.policy_id)
-        ).scalar_one_or_none()
-        if existing:
-            raise HTTPException(status_code=400, detail="Policy with this id already exists.")
-
-        row = PolicyModel(
-            policy_id=payload.policy_id,
-            description=payload.description,
-            severity=payload.severity,
-            match_json=json.dumps(payload.match_json),
-            action=payload.action,
-            version=1,
-        )
-        session.add(row)
-        session.flush()  # ensure row has defaults before snapshot
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            if _policy_exists(session, payload.policy_id):
+                raise HTTPException(status_code=400, detail="Policy with this id already exists.")
+
+            # INSERT ... RETURNING hands back the row with its defaults in one statement
+            row = session.scalar(
+                insert(PolicyModel).values(
+                    policy_id=payload.policy_id,
+                    description=payload.description,
+                    severity=payload.severity,
+                    match_json=json_codec.dumps(payload.match_json),
+                    action=payload.action,
+                    version=1,
+                ).returning(PolicyModel)
+            )
 
-        # Create initial version snapshot (v1)
-        _snapshot_version(session, row, created_by=user.username, note="Initial creation")
+            # Create initial version snapshot (v1)
+            _snapshot_version(session, row, created_by=user.username, note="Initial creation")
 
-        _log_policy_audit(
-            session, "create", payload.policy_id, user,
-            changes={"severity": payload.severity, "action": payload.action, "description": payload.description},
-        )
-        session.flush()
+            _log_policy_audit(
+                session, "create", payload.policy_id, user,
+                changes={"severity": payload.severity, "action": payload.action, "description": payload.description},
+            )
+            invalidate_policy_cache_on_commit(session)
 
-        invalidate_policy_cache()
+            return _row_to_read(row)
 
-        return _row_to_read(row)
+    return await run_in_db(_query)
 
 
 @router.patch("/{policy_id}", response_model=PolicyRead)
-def update_policy(
+async def update_policy(
     policy_id: str,
     payload: PolicyUpdate,
     user: User = Depends(require_operator),
@@ -394,90 +566,86 @@ def update_policy(
 
     Only the fields provided in the request body are changed.
     """
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        changes = payload.model_dump(exclude_unset=True)
-        if not changes:
-            raise HTTPException(status_code=400, detail="No fields to update.")
-
-        # Capture before-state for audit
-        before = {
-            "description": row.description,
-            "severity": row.severity,
-            "action": row.action,
-            "match_json": json.loads(row.match_json or "{}"),
-            "is_active": row.is_active,
-            "version": row.version or 1,
-        }
+    # Only the fields the client sent — no full model_dump walk
+    raw_changes = {f: getattr(payload, f) for f in payload.model_fields_set}
 
-        # Validate regex if match_json is being updated
-        if "match_json" in changes:
-            _validate_regex_fields(changes["match_json"])
-            changes["match_json"] = json.dumps(changes["match_json"])
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            row = _get_policy_or_404(session, policy_id)
 
-        for field, value in changes.items():
-            setattr(row, field, value)
+            changes = dict(raw_changes)
+            if not changes:
+                raise HTTPException(status_code=400, detail="No fields to update.")
 
-        # Increment version
-        row.version = (row.version or 1) + 1
-        row.updated_at = datetime.now(timezone.utc)
+            # Before-state for audit — only the fields being changed
+            before = {f: getattr(row, f) for f in changes if f != "match_json"}
+            if "match_json" in changes:
+                before["match_json"] = _spliced_match(row.match_json)
+            before["version"] = row.version or 1
 
-        # Snapshot the new version
-        _snapshot_version(session, row, created_by=user.username, note="Edited")
+            # Validate regex if match_json is being updated
+            if "match_json" in changes:
+                _validate_regex_fields(changes["match_json"])
+                changes["match_json"] = json_codec.dumps(changes["match_json"])
 
-        # Build after-state for audit (only changed fields)
-        after = {}
-        raw_changes = payload.model_dump(exclude_unset=True)
-        for k, v in raw_changes.items():
-            after[k] = v
-        after["version"] = row.version
+            for field, value in changes.items():
+                setattr(row, field, value)
 
-        _log_policy_audit(
-            session, "edit", policy_id, user,
-            changes={"before": before, "after": after},
-        )
-        session.flush()
-        invalidate_policy_cache()
+            # Increment version
+            row.version = (row.version or 1) + 1
+
+            # Snapshot the new version
+            _snapshot_version(session, row, created_by=user.username, note="Edited")
+
+            # Build after-state for audit (only changed fields)
+            after = {**raw_changes, "version": row.version}
+
+            _log_policy_audit(
+                session, "edit", policy_id, user,
+                changes={"before": before, "after": after},
+            )
+            session.flush()
+            invalidate_policy_cache_on_commit(session)
 
-        return _row_to_read(row)
+            return _row_to_read(row)
+
+    return await run_in_db(_query)
 
 
 @router.patch("/{policy_id}/toggle", response_model=PolicyRead)
-def toggle_policy(
+async def toggle_policy(
     policy_id: str,
     user: User = Depends(require_operator),
 ) -> PolicyRead:
     """Toggle a policy's active state. Requires operator or admin."""
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        was_active = row.is_active
-        row.is_active = not row.is_active
-        row.updated_at = datetime.now(timezone.utc)
-
-        audit_action = "activate" if row.is_active else "archive"
-        _log_policy_audit(
-            session, audit_action, policy_id, user,
-            changes={"is_active": {"before": was_active, "after": row.is_active}},
-            note=f"Toggled: {'archived → active' if row.is_active else 'active → archived'}",
-        )
-        session.flush()
-        invalidate_policy_cache()
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            # Flip in place and read the result back: one UPDATE ... RETURNING
+            row = session.scalar(
+                update(PolicyModel)
+                .where(PolicyModel.policy_id == policy_id)
+                .values(is_active=~PolicyModel.is_active)
+                .returning(PolicyModel)
+            )
+            if not row:
+                raise HTTPException(status_code=404, detail="Policy not found.")
+
+            was_active = not row.is_active
+            audit_action = "activate" if row.is_active else "archive"
+            _log_policy_audit(
+                session, audit_action, policy_id, user,
+                changes={"is_active": {"before": was_active, "after": row.is_active}},
+                note=f"Toggled: {'archived → active' if row.is_active else 'active → archived'}",
+            )
+            invalidate_policy_cache_on_commit(session)
 
-        return _row_to_read(row)
+            return _row_to_read(row)
+
+    return await run_in_db(_query)
 
 
 @router.patch("/{policy_id}/archive", response_model=PolicyRead)
-def archive_policy(
+async def archive_policy(
     policy_id: str,
     user: User = Depends(require_operator),
 ) -> PolicyRead:
@@ -486,28 +654,25 @@ def archive_policy(
     Archived policies are preserved in the database but excluded from
     the active evaluation pipeline. They can be re-activated at any time.
     """
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        if row.is_active:
-            row.is_active = False
-            row.updated_at = datetime.now(timezone.utc)
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            row = _set_active(session, policy_id, False)
+            if row is None:
+                # Already archived (idempotent) or missing
+                return _row_to_read(_get_policy_or_404(session, policy_id))
+
             _log_policy_audit(
                 session, "archive", policy_id, user,
                 changes={"is_active": {"before": True, "after": False}},
             )
-            session.flush()
-            invalidate_policy_cache()
+            invalidate_policy_cache_on_commit(session)
+            return _row_to_read(row)
 
-        return _row_to_read(row)
+    return await run_in_db(_query)
 
 
 @router.patch("/{policy_id}/activate", response_model=PolicyRead)
-def activate_policy(
+async def activate_policy(
     policy_id: str,
     user: User = Depends(require_operator),
 ) -> PolicyRead:
@@ -516,70 +681,70 @@ def activate_policy(
     Re-activates a previously archived policy, putting it back into
     the live evaluation pipeline immediately.
     """
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        if not row.is_active:
-            row.is_active = True
-            row.updated_at = datetime.now(timezone.utc)
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            row = _set_active(session, policy_id, True)
+            if row is None:
+                # Already activated (idempotent) or missing
+                return _row_to_read(_get_policy_or_404(session, policy_id))
+
             _log_policy_audit(
                 session, "activate", policy_id, user,
                 changes={"is_active": {"before": False, "after": True}},
             )
-            session.flush()
-            invalidate_policy_cache()
+            invalidate_policy_cache_on_commit(session)
+            return _row_to_read(row)
 
-        return _row_to_read(row)
+    return await run_in_db(_query)
 
 
 # ---------------------------------------------------------------------------
 # Version history & restore
 # ---------------------------------------------------------------------------
 
-@router.get("/{policy_id}/versions", response_model=List[PolicyVersionRead])
-def list_policy_versions(
+@router.get(
+    "/{policy_id}/versions",
+    response_model=None,
+    responses={200: {"model": List[PolicyVersionRead]}},
+)
+async def list_policy_versions(
     policy_id: str,
     _user: User = Depends(require_any),
-) -> List[PolicyVersionRead]:
+) -> json_codec.JSONResponse:
     """List all saved versions of a policy (newest first)."""
-    with db_session() as session:
-        # Verify policy exists
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        stmt = (
-            select(PolicyVersion)
-            .where(PolicyVersion.policy_id == policy_id)
-            .order_by(PolicyVersion.version.desc())
-        )
-        versions = session.execute(stmt).scalars().all()
-        return [
-            PolicyVersionRead(
-                id=v.id,
-                policy_id=v.policy_id,
-                version=v.version,
-                description=v.description,
-                severity=v.severity,
-                match_json=json.loads(v.match_json or "{}"),
-                action=v.action,
-                is_active=v.is_active,
-                created_by=v.created_by,
-                created_at=v.created_at,
-                note=v.note,
+    def _query() -> list[dict]:
+        with db_session() as session:
+            if not _policy_exists(session, policy_id):
+                raise HTTPException(status_code=404, detail="Policy not found.")
+
+            stmt = (
+                select(PolicyVersion)
+                .where(PolicyVersion.policy_id == policy_id)
+                .order_by(PolicyVersion.version.desc())
             )
-            for v in versions
-        ]
+            versions = session.execute(stmt).scalars().all()
+            return [
+                {
+                    "id": v.id,
+                    "policy_id": v.policy_id,
+                    "version": v.version,
+                    "description": v.description,
+                    "severity": v.severity,
+                    "match_json": decode_match_json(v.match_json),
+                    "action": v.action,
+                    "is_active": v.is_active,
+                    "created_by": v.created_by,
+                    "created_at": v.created_at,
+                    "note": v.note,
+                }
+                for v in versions
+            ]
+
+    return json_codec.JSONResponse(await run_in_db(_query))
 
 
 @router.post("/{policy_id}/restore/{version}", response_model=PolicyRead)
-def restore_policy_version(
+async def restore_policy_version(
     policy_id: str,
     version: int,
     user: User = Depends(require_operator),
@@ -590,82 +755,86 @@ def restore_policy_version(
     Creates a *new* version with the content from the specified historical
     version — history is never rewritten.
     """
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        target = session.execute(
-            select(PolicyVersion)
-            .where(PolicyVersion.policy_id == policy_id)
-            .where(PolicyVersion.version == version)
-        ).scalar_one_or_none()
-        if not target:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Version {version} not found for policy '{policy_id}'.",
+    def _query() -> PolicyRead:
+        with db_session() as session:
+            target = session.execute(
+                select(PolicyVersion)
+                .where(PolicyVersion.policy_id == policy_id)
+                .where(PolicyVersion.version == version)
+            ).scalar_one_or_none()
+            if not target:
+                if not _policy_exists(session, policy_id):
+                    raise HTTPException(status_code=404, detail="Policy not found.")
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Version {version} not found for policy '{policy_id}'.",
+                )
+
+            # Apply historical values and bump the version in one UPDATE ... RETURNING
+            row = session.scalar(
+                update(PolicyModel)
+                .where(PolicyModel.policy_id == policy_id)
+                .values(
+                    description=target.description,
+                    severity=target.severity,
+                    match_json=target.match_json,
+                    action=target.action,
+                    is_active=target.is_active,
+                    version=func.coalesce(PolicyModel.version, 1) + 1,
+                )
+                .returning(PolicyModel)
+            )
+            if not row:
+                raise HTTPException(status_code=404, detail="Policy not found.")
+
+            # Snapshot the restored version
+            _snapshot_version(
+                session, row,
+                created_by=user.username,
+                note=f"Restored from v{version}",
             )
 
-        before_version = row.version or 1
-
-        # Apply historical values
-        row.description = target.description
-        row.severity = target.severity
-        row.match_json = target.match_json
-        row.action = target.action
-        row.is_active = target.is_active
-        row.version = before_version + 1
-        row.updated_at = datetime.now(timezone.utc)
-
-        # Snapshot the restored version
-        _snapshot_version(
-            session, row,
-            created_by=user.username,
-            note=f"Restored from v{version}",
-        )
+            _log_policy_audit(
+                session, "restore", policy_id, user,
+                changes={
+                    "restored_from_version": version,
+                    "new_version": row.version,
+                },
+                note=f"Restored to content from v{version}",
+            )
+            invalidate_policy_cache_on_commit(session)
 
-        _log_policy_audit(
-            session, "restore", policy_id, user,
-            changes={
-                "restored_from_version": version,
-                "new_version": row.version,
-            },
-            note=f"Restored to content from v{version}",
-        )
-        session.flush()
-        invalidate_policy_cache()
+            return _row_to_read(row)
 
-        return _row_to_read(row)
+    return await run_in_db(_query)
 
 
 @router.delete("/{policy_id}")
-def delete_policy(
+async def delete_policy(
     policy_id: str,
     user: User = Depends(require_operator),
 ) -> dict:
     """Delete a dynamic policy by its ID. Requires operator or admin."""
-    with db_session() as session:
-        row = session.execute(
-            select(PolicyModel).where(PolicyModel.policy_id == policy_id)
-        ).scalar_one_or_none()
-        if not row:
-            raise HTTPException(status_code=404, detail="Policy not found.")
-
-        # Capture full state before deletion for audit
-        _log_policy_audit(
-            session, "delete", policy_id, user,
-            changes={
-                "description": row.description,
-                "severity": row.severity,
-                "action": row.action,
-                "is_active": row.is_active,
-                "match_json": json.loads(row.match_json or "{}"),
-            },
-            note="Permanently deleted",
-        )
+    def _query() -> dict:
+        with db_session() as session:
+            row = _get_policy_or_404(session, policy_id)
+
+            # Capture full state before deletion for audit
+            _log_policy_audit(
+                session, "delete", policy_id, user,
+                changes={
+                    "description": row.description,
+                    "severity": row.severity,
+                    "action": row.action,
+                    "is_active": row.is_active,
+                    # Stored text spliced straight into the audit JSON
+                    "match_json": _spliced_match(row.match_json),
+                },
+                note="Permanently deleted",
+            )
+
+            session.delete(row)
+            invalidate_policy_cache_on_commit(session)
+            return {"status": "deleted", "policy_id": policy_id}
 
-        session.delete(row)
-        invalidate_policy_cache()
-        return {"status": "deleted", "policy_id": policy_id}
+    return await run_in_db(_query)
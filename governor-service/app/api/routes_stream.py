@@ -19,7 +19,7 @@ from __future__ import annotations
 import asyncio
 from typing import AsyncGenerator
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
 from ..auth.dependencies import require_any
@@ -30,34 +30,35 @@ router = APIRouter(prefix="/actions", tags=["stream"])
 
 HEARTBEAT_INTERVAL = 15  # seconds
 
+# Identical for every client, so built once
+CONNECTED_FRAME = b'event: connected\ndata: {"status":"streaming"}\n\n'
+HEARTBEAT_FRAME = b": heartbeat\n\n"
+
 
 async def _event_generator(
-    request: Request,
     queue: asyncio.Queue[ActionEvent],
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Yield SSE-formatted messages from the event bus.
 
     Sends a heartbeat comment every HEARTBEAT_INTERVAL seconds to
-    prevent proxies from closing idle connections.  Exits cleanly
-    when the client disconnects.
+    prevent proxies from closing idle connections.  There is no
+    disconnect polling: ``StreamingResponse`` already listens for
+    ``http.disconnect`` and cancels this generator, and the ``finally``
+    unsubscribes.
     """
     try:
         # Initial connection event
-        yield "event: connected\ndata: {\"status\":\"streaming\"}\n\n"
+        yield CONNECTED_FRAME
 
         while True:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                break
-
             try:
                 event = await asyncio.wait_for(
                     queue.get(), timeout=HEARTBEAT_INTERVAL
                 )
-                yield f"event: {event.event_type}\ndata: {event.to_json()}\n\n"
+                yield event.sse_frame()  # shared, pre-encoded bytes
             except asyncio.TimeoutError:
                 # Send heartbeat to keep connection alive
-                yield ": heartbeat\n\n"
+                yield HEARTBEAT_FRAME
     finally:
         action_bus.unsubscribe(queue)
 
@@ -79,7 +80,6 @@ async def _event_generator(
     },
 )
 async def stream_actions(
-    request: Request,
     _user: User = Depends(require_any),
 ):
     """Stream governance events in real time via Server-Sent Events.
@@ -101,7 +101,7 @@ async def stream_actions(
         raise HTTPException(status_code=503, detail=str(exc))
 
     return StreamingResponse(
-        _event_generator(request, queue),
+        _event_generator(queue),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1,48 +1,93 @@
 from __future__ import annotations
 
+import logging
+import time
+from threading import Lock
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select, desc
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import case, func, select, desc
+from sqlalchemy.exc import SQLAlchemyError
 
 from ..auth.dependencies import require_any
+from ..config import settings
 from ..database import db_session
 from ..models import ActionLog, User
 from ..schemas import SummaryOut
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
+logger = logging.getLogger("governor.summary")
+
+# Last computed summary → (computed_at monotonic, result). The response has
+# no per-user data, so one entry serves every caller.
+_summary_cache: Optional[tuple[float, SummaryOut]] = None
+_summary_lock = Lock()
+
 
 @router.get("/moltbook", response_model=SummaryOut)
-def moltbook_summary(_user: User = Depends(require_any)) -> SummaryOut:
+def moltbook_summary(
+    response: Response,
+    _user: User = Depends(require_any),
+) -> SummaryOut:
     """
     Rich governance summary for Moltbook reporter consumption.
 
     Returns per-decision counts, average risk score, top blocked tool,
     and a pre-formatted narrative message — all the data the reporter
     skill needs in a single call.
+
+    Cached for ``settings.summary_cache_ttl_seconds`` so polling dashboards
+    don't rescan ``action_logs``; if the database errors, the last good
+    summary is served instead. ``X-Cache`` reports HIT, MISS or STALE.
     """
-    with db_session() as session:
-        total = session.execute(select(func.count(ActionLog.id))).scalar_one() or 0
+    global _summary_cache
 
-        blocked = (
-            session.execute(
-                select(func.count(ActionLog.id)).where(ActionLog.decision == "block")
-            ).scalar_one() or 0
-        )
-        allowed = (
-            session.execute(
-                select(func.count(ActionLog.id)).where(ActionLog.decision == "allow")
-            ).scalar_one() or 0
-        )
-        under_review = (
-            session.execute(
-                select(func.count(ActionLog.id)).where(ActionLog.decision == "review")
-            ).scalar_one() or 0
-        )
-        avg_risk = (
-            session.execute(select(func.avg(ActionLog.risk_score))).scalar_one() or 0.0
-        )
+    ttl = settings.summary_cache_ttl_seconds
+    cached = _summary_cache
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        response.headers["X-Cache"] = "HIT"
+        return cached[1]
+
+    with _summary_lock:
+        cached = _summary_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            response.headers["X-Cache"] = "HIT"  # computed by the caller we waited on
+            return cached[1]
+        try:
+            summary = _compute_summary()
+        except SQLAlchemyError:
+            if cached is None:
+                raise
+            logger.warning("Summary query failed; serving last good summary", exc_info=True)
+            response.headers["X-Cache"] = "STALE"
+            return cached[1]
+        _summary_cache = (time.monotonic(), summary)
+
+    response.headers["X-Cache"] = "MISS"
+    return summary
+
+
+def _compute_summary() -> SummaryOut:
+    with db_session() as session:
+        # Counts, average and high-risk tally in one pass over action_logs
+        total, blocked, allowed, under_review, avg_risk, high_risk = session.execute(
+            select(
+                func.count(ActionLog.id),
+                func.sum(case((ActionLog.decision == "block", 1), else_=0)),
+                func.sum(case((ActionLog.decision == "allow", 1), else_=0)),
+                func.sum(case((ActionLog.decision == "review", 1), else_=0)),
+                func.avg(ActionLog.risk_score),
+                func.sum(case((ActionLog.risk_score >= 80, 1), else_=0)),
+            )
+        ).one()
+        # SUM/AVG over an empty table are NULL
+        total = total or 0
+        blocked = blocked or 0
+        allowed = allowed or 0
+        under_review = under_review or 0
+        avg_risk = avg_risk or 0.0
+        high_risk = high_risk or 0
 
         # Top blocked tool – most frequently occurring tool in blocked actions
         top_blocked_row = (
@@ -56,13 +101,6 @@ def moltbook_summary(_user: User = Depends(require_any)) -> SummaryOut:
         )
         top_blocked_tool = top_blocked_row[0] if top_blocked_row else None
 
-        # High-risk count (risk_score >= 80)
-        high_risk = (
-            session.execute(
-                select(func.count(ActionLog.id)).where(ActionLog.risk_score >= 80)
-            ).scalar_one() or 0
-        )
-
     block_pct = round(blocked / total * 100) if total else 0
 
     if total == 0:
@@ -19,6 +19,9 @@ Connects the OpenClaw Governor to the SURGE token economy:
 
 4. **Governance Receipts** — Every evaluation produces a SHA-256 signed
    receipt persisted in the database, suitable for on-chain attestation.
+   BLAKE2b-160 (optionally keyed) is available via
+   ``GOVERNOR_SURGE_RECEIPT_DIGEST=blake2b`` where on-chain
+   compatibility is not needed.
 
 5. **Virtual Wallets** — Each agent/org maintains a $SURGE wallet with
    a ledger of deposits and fee deductions. When balance ≤ 0, further
@@ -29,15 +32,17 @@ on restarts.
 """
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from hashlib import sha256
-from typing import List, Optional
+from hashlib import blake2b, sha256
+from threading import Lock
+from typing import Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func
+from sqlalchemy import delete, func, select
 
 from ..auth.dependencies import require_any, require_operator
 from ..config import settings
@@ -83,7 +88,10 @@ class GovernanceReceipt(BaseModel):
     policy_ids: List[str] = Field(default_factory=list)
     chain_pattern: Optional[str] = None
     agent_id: Optional[str] = None
-    digest: str = Field(description="SHA-256 digest of receipt payload for integrity verification")
+    digest: str = Field(
+        description="Hex digest of the receipt payload for integrity verification — "
+        "SHA-256 by default, BLAKE2b-160 (optionally keyed) when so configured",
+    )
     governance_fee_surge: Optional[str] = Field(
         default=None,
         description="$SURGE fee charged for this evaluation (tiered by risk score)",
@@ -148,7 +156,7 @@ class WalletTopUp(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Helper: SHA-256 receipt digest
+# Helper: receipt digest
 # ---------------------------------------------------------------------------
 
 def _compute_digest(
@@ -159,9 +167,17 @@ def _compute_digest(
     risk_score: int,
     policy_ids: List[str],
 ) -> str:
-    """SHA-256 digest of receipt payload for integrity verification."""
-    payload = f"{receipt_id}|{timestamp}|{tool}|{decision}|{risk_score}|{','.join(policy_ids)}"
-    return sha256(payload.encode()).hexdigest()
+    """Digest of receipt payload for integrity verification.
+
+    The payload is ``receipt_id|timestamp|tool|decision|risk_score|p1,p2,...``;
+    one ``join`` builds it with a single allocation. SHA-256 (64 hex chars)
+    unless ``surge_receipt_digest`` is ``blake2b``: BLAKE2b-160 (40 hex chars),
+    keyed with ``surge_receipt_digest_key`` when set, which makes it a MAC.
+    """
+    payload = "|".join((receipt_id, timestamp, tool, decision, str(risk_score), ",".join(policy_ids))).encode()
+    if settings.surge_receipt_digest == "blake2b":
+        return blake2b(payload, digest_size=20, key=settings.surge_receipt_digest_key.encode()).hexdigest()
+    return sha256(payload).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -216,6 +232,8 @@ def create_governance_receipt(
                 fee_paid += fee_amount
                 wallet.balance = f"{balance:.4f}"
                 wallet.total_fees_paid = f"{fee_paid:.4f}"
+                if balance <= 0:
+                    invalidate_wallet_cache(agent_id)
 
     return GovernanceReceipt(
         receipt_id=receipt_id,
@@ -231,17 +249,46 @@ def create_governance_receipt(
     )
 
 
+# Agents whose wallet was recently seen with a positive balance → expiry
+# (monotonic). Only "funded" is cached, so a 402 is never served stale; an
+# entry is dropped as soon as a fee deduction empties the wallet.
+_funded_until: Dict[str, float] = {}
+_funded_lock = Lock()
+_FUNDED_CACHE_MAX = 10_000
+
+
+def _mark_funded(agent_id: str) -> None:
+    ttl = settings.surge_wallet_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    with _funded_lock:
+        if len(_funded_until) >= _FUNDED_CACHE_MAX:
+            _funded_until.clear()
+        _funded_until[agent_id] = time.monotonic() + ttl
+
+
+def invalidate_wallet_cache(wallet_id: str) -> None:
+    """Forget the cached balance check for a wallet (after any balance change)."""
+    with _funded_lock:
+        _funded_until.pop(wallet_id, None)
+
+
 def check_wallet_balance(agent_id: Optional[str]) -> None:
     """Raise 402 if fee gating is enabled and the agent has insufficient balance.
 
     Called from /evaluate BEFORE running the governance pipeline.
     If the agent has no wallet, one is auto-created with 100 SURGE.
+    A positive result is cached for ``settings.surge_wallet_cache_ttl_seconds``.
     """
     if not settings.surge_governance_fee_enabled:
         return
     if not agent_id:
         return  # anonymous calls not gated
 
+    expiry = _funded_until.get(agent_id)
+    if expiry is not None and expiry > time.monotonic():
+        return
+
     with db_session() as session:
         wallet = session.execute(
             select(SurgeWallet).where(SurgeWallet.wallet_id == agent_id)
@@ -251,6 +298,7 @@ def check_wallet_balance(agent_id: Optional[str]) -> None:
             # Auto-provision wallet with default balance
             wallet = SurgeWallet(wallet_id=agent_id, label=f"Auto: {agent_id}")
             session.add(wallet)
+            _mark_funded(agent_id)
             return  # fresh wallet, balance is 100.0000
 
         balance = Decimal(wallet.balance)
@@ -267,6 +315,7 @@ def check_wallet_balance(agent_id: Optional[str]) -> None:
                     ),
                 },
             )
+        _mark_funded(agent_id)
 
 
 # ---------------------------------------------------------------------------
@@ -283,21 +332,18 @@ def surge_status(_user: User = Depends(require_any)) -> SurgeGovernanceStatus:
             select(func.count(SurgeReceipt.id))
         ).scalar_one_or_none() or 0
 
-        total_policies = session.execute(
-            select(func.count(SurgeStakedPolicy.id)).where(SurgeStakedPolicy.is_active == True)  # noqa: E712
-        ).scalar_one_or_none() or 0
-
-        # Compute staked total
+        # Active stakes: one read gives both the count and the exact Decimal total
         staked_rows = session.execute(
             select(SurgeStakedPolicy.staked_surge).where(SurgeStakedPolicy.is_active == True)  # noqa: E712
         ).scalars().all()
-        staked_sum = sum(Decimal(s) for s in staked_rows) if staked_rows else Decimal(0)
+        total_policies = len(staked_rows)
+        staked_sum = sum(map(Decimal, staked_rows), Decimal(0))
 
         # Total fees collected across all wallets
         fee_rows = session.execute(
             select(SurgeWallet.total_fees_paid)
         ).scalars().all()
-        fees_sum = sum(Decimal(f) for f in fee_rows) if fee_rows else Decimal(0)
+        fees_sum = sum(map(Decimal, fee_rows), Decimal(0))
 
     return SurgeGovernanceStatus(
         fee_gating_enabled=settings.surge_governance_fee_enabled,
@@ -316,8 +362,8 @@ def surge_status(_user: User = Depends(require_any)) -> SurgeGovernanceStatus:
 
 @router.get("/receipts", response_model=List[GovernanceReceipt])
 def list_receipts(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
     _user: User = Depends(require_any),
 ) -> List[GovernanceReceipt]:
     """List recent governance receipts (newest first). DB-persisted."""
@@ -437,13 +483,14 @@ def unstake_policy(
 ) -> dict:
     """Remove a policy stake (returns $SURGE to staker)."""
     with db_session() as session:
-        row = session.execute(
-            select(SurgeStakedPolicy).where(SurgeStakedPolicy.policy_id == policy_id)
+        # Remove and read back the stake in one DELETE ... RETURNING
+        returned = session.execute(
+            delete(SurgeStakedPolicy)
+            .where(SurgeStakedPolicy.policy_id == policy_id)
+            .returning(SurgeStakedPolicy.staked_surge)
         ).scalar_one_or_none()
-        if not row:
+        if returned is None:
             raise HTTPException(status_code=404, detail="Staked policy not found.")
-        returned = row.staked_surge
-        session.delete(row)
 
     return {
         "status": "unstaked",
@@ -476,6 +523,7 @@ def create_wallet(
             total_deposited=body.initial_balance,
         )
         session.add(wallet)
+        invalidate_wallet_cache(body.wallet_id)
         session.flush()
         session.refresh(wallet)
         return _wallet_read(wallet)
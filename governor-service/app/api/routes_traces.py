@@ -83,7 +83,7 @@ def _action_to_read(row: ActionLog) -> ActionLogRead:
         decision=row.decision,
         risk_score=row.risk_score,
         explanation=row.explanation,
-        policy_ids=[p for p in (row.policy_ids or "").split(",") if p],
+        policy_ids=row.policy_ids,
         agent_id=row.agent_id,
         session_id=row.session_id,
         user_id=row.user_id,
@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./governor.db"
     log_sql: bool = False
+    db_executor_workers: int = 16  # threads serving DB work for async route handlers
+    db_pool_size: int = 20         # pooled connections (ignored for SQLite)
+    db_max_overflow: int = 10
 
     # Server
     environment: str = "development"
@@ -36,9 +39,18 @@ class Settings(BaseSettings):
     login_rate_limit: str = "5/minute"
     evaluate_rate_limit: str = "120/minute"
 
+    # Summary
+    summary_cache_ttl_seconds: float = 10.0  # 0 disables the /summary/moltbook response cache
+
+    # Tracing
+    trace_deep_default: bool = True  # governance spans carry layer trace + I/O unless context sets trace_deep=false
+
     # SURGE integration
     surge_governance_fee_enabled: bool = False
     surge_wallet_address: str = ""
+    surge_wallet_cache_ttl_seconds: float = 10.0  # 0 disables the funded-wallet cache
+    surge_receipt_digest: str = "sha256"                # sha256 | blake2b (160-bit, optionally keyed)
+    surge_receipt_digest_key: str = ""                  # blake2b key (≤ 64 bytes); empty = unkeyed
 
     # ── Compliance modules ──────────────────────────────────────────
     modules_enabled: bool = True                       # Master toggle for all optional modules
@@ -112,6 +124,20 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("surge_receipt_digest")
+    @classmethod
+    def validate_surge_receipt_digest(cls, v: str) -> str:
+        if v not in ("sha256", "blake2b"):
+            raise ValueError("GOVERNOR_SURGE_RECEIPT_DIGEST must be 'sha256' or 'blake2b'.")
+        return v
+
+    @field_validator("surge_receipt_digest_key")
+    @classmethod
+    def validate_surge_receipt_digest_key(cls, v: str) -> str:
+        if len(v.encode()) > 64:
+            raise ValueError("GOVERNOR_SURGE_RECEIPT_DIGEST_KEY must be at most 64 bytes.")
+        return v
+
     @field_validator("allow_cors_origins")
     @classmethod
     def validate_cors_origins(cls, v: List[str], info) -> List[str]:
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, TypeVar
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
@@ -8,15 +12,27 @@ from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 from .config import settings
 
 
+T = TypeVar("T")
+
+
 class Base(DeclarativeBase):
     pass
 
 
+_is_sqlite = "sqlite" in settings.database_url
+
 engine = create_engine(
     settings.database_url,
     echo=settings.log_sql,
     future=True,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    # Server databases: keep enough pooled connections for every DB executor
+    # thread, and drop dead ones before use instead of failing a request.
+    **({} if _is_sqlite else {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+    }),
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
@@ -40,3 +56,18 @@ def get_db_session():
     """FastAPI dependency that yields a session and commits on exit."""
     with db_session() as session:
         yield session
+
+
+# Dedicated executor for blocking ORM work issued from ``async def`` handlers.
+# Keeps DB round-trips off the event loop without competing with Starlette's
+# shared threadpool (which also serves every sync route and dependency).
+_db_executor = ThreadPoolExecutor(
+    max_workers=settings.db_executor_workers,
+    thread_name_prefix="governor-db",
+)
+
+
+async def run_in_db(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable (typically wrapping ``db_session()``) on the DB executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, partial(fn, *args, **kwargs))
@@ -12,12 +12,20 @@ When GOVERNOR_ENCRYPTION_KEY is not set, storage falls back to plain text
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Sequence
 
 logger = logging.getLogger("governor.encryption")
 
 _fernet = None
 _initialized = False
 
+# Batches smaller than this are encrypted inline — pool dispatch costs more
+_PARALLEL_MIN_BATCH = 32
+_pool: ThreadPoolExecutor | None = None
+
 
 def _get_fernet():
     """Lazily initialise Fernet cipher from settings."""
@@ -42,24 +50,86 @@ def _get_fernet():
     return _fernet
 
 
-def encrypt_value(plain_text: str) -> str:
-    """Encrypt a string value. Returns the encrypted token or plain text if no key."""
-    f = _get_fernet()
-    if f is None:
-        return plain_text
+def _encrypt(plain_text: str) -> str:
+    """Encrypt a string value. Returns the encrypted token, or plain text on failure."""
     try:
-        return f.encrypt(plain_text.encode()).decode()
+        return _fernet.encrypt(plain_text.encode()).decode()
     except Exception:
         return plain_text
 
 
-def decrypt_value(encrypted_text: str) -> str:
-    """Decrypt a string value. Returns plain text if decryption fails or no key."""
-    f = _get_fernet()
-    if f is None:
-        return encrypted_text
+def _decrypt(encrypted_text: str) -> str:
+    """Decrypt a string value. Returns the input unchanged if decryption fails."""
     try:
-        return f.decrypt(encrypted_text.encode()).decode()
+        return _fernet.decrypt(encrypted_text.encode()).decode()
     except Exception:
         # Could be plain text stored before encryption was enabled
         return encrypted_text
+
+
+def _passthrough(text: str) -> str:
+    """No key configured — values are stored and read as plain text."""
+    return text
+
+
+# The key comes from settings, which are fixed at import, so pick the
+# implementation once here rather than re-checking the cipher on every call.
+if _get_fernet() is None:
+    encrypt_value = decrypt_value = _passthrough
+else:
+    encrypt_value, decrypt_value = _encrypt, _decrypt
+
+
+# Bounds on the plain text held by decrypt_cached(): at most this many
+# entries, each from a token no longer than the size limit (~6 MB in all).
+_DECRYPT_CACHE_SIZE = 2048
+_DECRYPT_CACHE_MAX_TOKEN = 4096
+
+
+@lru_cache(maxsize=_DECRYPT_CACHE_SIZE)
+def _decrypt_memo(encrypted_text: str) -> str:
+    return decrypt_value(encrypted_text)
+
+
+def decrypt_cached(encrypted_text: str) -> str:
+    """``decrypt_value`` memoised by ciphertext, for read paths that re-serve the same rows.
+
+    Fernet tokens carry a random IV, so equal ciphertext always means equal
+    plain text. Only short values are cached — large ones (full prompts and
+    responses) are decrypted per call rather than kept resident — and
+    nothing is cached without a key, where there is no work to save.
+    """
+    if decrypt_value is _passthrough or len(encrypted_text) > _DECRYPT_CACHE_MAX_TOKEN:
+        return decrypt_value(encrypted_text)
+    return _decrypt_memo(encrypted_text)
+
+
+def rotate_encryption_key(new_key: str, *old_keys: str) -> None:
+    """Encrypt with ``new_key`` from now on; still decrypt values written under ``old_keys``.
+
+    Drops every cached plain text, so nothing decrypted under a retired key
+    outlives it. Only possible when encryption was enabled at startup.
+    """
+    global _fernet
+    if _get_fernet() is None:
+        raise RuntimeError("Encryption is not enabled — set GOVERNOR_ENCRYPTION_KEY and restart.")
+    from cryptography.fernet import Fernet, MultiFernet
+    _fernet = MultiFernet([Fernet(k.encode()) for k in (new_key, *old_keys)])
+    _decrypt_memo.cache_clear()
+
+
+def encrypt_values(plain_texts: Sequence[Optional[str]]) -> list[Optional[str]]:
+    """Encrypt many values, preserving order. ``None`` / empty entries stay ``None``.
+
+    Large batches are spread over a small thread pool; the AES and HMAC work
+    runs in OpenSSL, so Fernet calls overlap across threads.
+    """
+    global _pool
+    if _get_fernet() is None or len(plain_texts) < _PARALLEL_MIN_BATCH:
+        return [encrypt_value(v) if v else None for v in plain_texts]
+    if _pool is None:
+        _pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="governor-encrypt",
+        )
+    return list(_pool.map(lambda v: encrypt_value(v) if v else None, plain_texts))
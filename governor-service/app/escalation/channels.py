@@ -18,21 +18,90 @@ from __future__ import annotations
 import json
 import logging
 import smtplib
+import time
 from datetime import datetime, timezone
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Optional, Tuple
 
 import httpx
 from sqlalchemy import select
 
 from ..database import db_session
 from ..encryption import decrypt_value
+from ..schemas import NotificationChannelRead
 from .models import NotificationChannel
 
 logger = logging.getLogger("governor.channels")
 
 
+@lru_cache(maxsize=1024)
+def _decode_config_cached(raw: str) -> dict:
+    try:
+        return json.loads(decrypt_value(raw))
+    except (json.JSONDecodeError, TypeError):
+        return json.loads(raw)
+
+
+def decode_channel_config(raw) -> dict:
+    """Decrypt (if encryption is enabled) and parse a stored ``config_json``.
+
+    Memoised by the stored text — an edited config is a new key, so no
+    invalidation is needed. Returns a copy callers may mutate.
+    """
+    if not isinstance(raw, str):
+        return raw
+    return dict(_decode_config_cached(raw))
+
+
+# ---------------------------------------------------------------------------
+# Channel read cache
+# ---------------------------------------------------------------------------
+
+# Single-channel API reads, by id → (expiry, read model). Channels change
+# rarely; every write path (PATCH/DELETE, test sends, dispatch stats)
+# invalidates. Invalidation is per process: with several workers, a write
+# made through one can be served stale by the others for up to
+# _CHANNEL_CACHE_TTL.
+_CHANNEL_CACHE_TTL = 60.0
+_channel_cache: Dict[int, Tuple[float, NotificationChannelRead]] = {}
+_channel_cache_gen: int = 0          # bumped by every invalidation
+_channel_cache_lock = Lock()
+
+
+def cached_channel_read(channel_id: int) -> Optional[NotificationChannelRead]:
+    """The cached read model for ``channel_id``, if present and fresh."""
+    cached = _channel_cache.get(channel_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def channel_cache_generation() -> int:
+    """Capture before reading a row; pass to ``cache_channel_read``."""
+    return _channel_cache_gen
+
+
+def cache_channel_read(read: NotificationChannelRead, gen: int) -> NotificationChannelRead:
+    """Cache ``read`` unless an invalidation landed since it was read (``gen``)."""
+    with _channel_cache_lock:
+        if gen != _channel_cache_gen:
+            return read  # may predate a committed write — don't re-fill stale
+        if len(_channel_cache) >= 1024:
+            _channel_cache.clear()
+        _channel_cache[read.id] = (time.monotonic() + _CHANNEL_CACHE_TTL, read)
+    return read
+
+
+def invalidate_channel_cache(channel_id: int) -> None:
+    global _channel_cache_gen
+    with _channel_cache_lock:
+        _channel_cache_gen += 1
+        _channel_cache.pop(channel_id, None)
+
+
 # ---------------------------------------------------------------------------
 # Channel dispatchers
 # ---------------------------------------------------------------------------
@@ -326,6 +395,7 @@ def dispatch_notification_channels(
     Returns the number of channels that succeeded.
     """
     sent = 0
+    touched: list[int] = []
     try:
         with db_session() as session:
             stmt = select(NotificationChannel).where(
@@ -344,14 +414,7 @@ def dispatch_notification_channels(
                 if event_type == "policy_change" and not ch.on_policy_change:
                     continue
 
-                config = json.loads(ch.config_json) if isinstance(ch.config_json, str) else ch.config_json
-                # Decrypt secrets if encryption is enabled
-                raw = ch.config_json if isinstance(ch.config_json, str) else json.dumps(ch.config_json)
-                decrypted = decrypt_value(raw)
-                try:
-                    config = json.loads(decrypted)
-                except (json.JSONDecodeError, TypeError):
-                    pass  # config already parsed above
+                config = decode_channel_config(ch.config_json)
                 dispatcher = _DISPATCHERS.get(ch.channel_type)
                 if not dispatcher:
                     logger.warning("Unknown channel type %r for channel %r", ch.channel_type, ch.label)
@@ -365,10 +428,13 @@ def dispatch_notification_channels(
                     sent += 1
                 else:
                     ch.error_count = (ch.error_count or 0) + 1
+                touched.append(ch.id)
 
     except Exception as exc:
         logger.warning("Failed to dispatch notification channels: %s", exc)
 
+    for channel_id in touched:
+        invalidate_channel_cache(channel_id)
     return sent
 
 
@@ -389,14 +455,7 @@ def test_notification_channel(channel_id: int) -> dict:
         if not ch:
             return {"success": False, "error": "Channel not found"}
 
-        config = json.loads(ch.config_json) if isinstance(ch.config_json, str) else ch.config_json
-        # Decrypt secrets if encryption is enabled
-        raw = ch.config_json if isinstance(ch.config_json, str) else json.dumps(ch.config_json)
-        raw = decrypt_value(raw)
-        try:
-            config = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            pass  # already parsed above
+        config = decode_channel_config(ch.config_json)
         dispatcher = _DISPATCHERS.get(ch.channel_type)
         if not dispatcher:
             return {"success": False, "error": f"Unknown channel type: {ch.channel_type}"}
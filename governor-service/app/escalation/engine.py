@@ -17,7 +17,7 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import httpx
 from sqlalchemy import select, func
@@ -300,6 +300,7 @@ def handle_post_evaluation(
     agent_id: Optional[str],
     session_id: Optional[str],
     action_log_id: Optional[int] = None,
+    defer_notifications: Optional[Callable[..., Any]] = None,
 ) -> dict:
     """
     Post-evaluation escalation logic. Called from routes_actions after
@@ -311,6 +312,11 @@ def handle_post_evaluation(
     3. Check auto-kill-switch thresholds
     4. Dispatch webhook notifications
 
+    Steps 1-3 always run inline, so ``auto_ks_triggered`` reflects this
+    action. Pass ``defer_notifications`` (e.g. ``BackgroundTasks.add_task``)
+    to schedule step 4 instead of running it; ``webhooks_dispatched`` then
+    means "scheduled".
+
     Returns a dict summarising what happened (for response enrichment).
     """
     result = {
@@ -387,6 +393,38 @@ def handle_post_evaluation(
         )
 
     # ── Step 3: Dispatch webhooks ──
+    notify_args = (decision, tool, risk_score, explanation, policy_ids,
+                   chain_pattern, agent_id, config, ks_trigger)
+    if _has_notifications(decision, config, ks_trigger):
+        if defer_notifications is not None:
+            defer_notifications(_dispatch_post_eval_notifications, *notify_args)
+        else:
+            _dispatch_post_eval_notifications(*notify_args)
+        result["webhooks_dispatched"] = True
+
+    return result
+
+
+def _has_notifications(decision: str, config: dict, ks_trigger: Optional[dict]) -> bool:
+    return bool(
+        (decision == "block" and config.get("notify_on_block"))
+        or (decision == "review" and config.get("notify_on_review"))
+        or (ks_trigger and config.get("notify_on_auto_ks"))
+    )
+
+
+def _dispatch_post_eval_notifications(
+    decision: str,
+    tool: str,
+    risk_score: int,
+    explanation: str,
+    policy_ids: list[str],
+    chain_pattern: Optional[str],
+    agent_id: Optional[str],
+    config: dict,
+    ks_trigger: Optional[dict],
+) -> None:
+    """Send the webhooks / channel notifications for one evaluation."""
     if decision == "block" and config.get("notify_on_block"):
         webhook_payload = _build_webhook_payload(
             "action_blocked", tool, decision, risk_score, explanation,
@@ -394,7 +432,6 @@ def handle_post_evaluation(
         )
         dispatch_webhooks("block", webhook_payload)
         dispatch_notification_channels("block", webhook_payload)
-        result["webhooks_dispatched"] = True
 
     if decision == "review" and config.get("notify_on_review"):
         webhook_payload = _build_webhook_payload(
@@ -403,7 +440,6 @@ def handle_post_evaluation(
         )
         dispatch_webhooks("review", webhook_payload)
         dispatch_notification_channels("review", webhook_payload)
-        result["webhooks_dispatched"] = True
 
     if ks_trigger and config.get("notify_on_auto_ks"):
         ks_payload = {
@@ -417,9 +453,6 @@ def handle_post_evaluation(
         }
         dispatch_webhooks("auto_ks", ks_payload)
         dispatch_notification_channels("auto_ks", ks_payload)
-        result["webhooks_dispatched"] = True
-
-    return result
 
 
 def _build_webhook_payload(
@@ -6,15 +6,20 @@ SSE listeners (connected via /actions/stream) receive the event instantly.
 
 Uses asyncio.Queue per subscriber so each dashboard tab / client gets
 its own independent stream. Subscribers are cleaned up on disconnect.
+
+Once ``start()`` has run (app lifespan), ``publish()`` only hands the event
+to an outbox queue and returns; a drain task on the event loop does the
+fan-out. Without it (unit tests, scripts) events are fanned out inline.
 """
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+from . import json_codec
+
 
 @dataclass
 class ActionEvent:
@@ -32,32 +37,90 @@ class ActionEvent:
     channel: Optional[str] = None
     chain_pattern: Optional[str] = None
     timestamp: float = field(default_factory=time.time)
+    _frame: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "event": self.event_type,
-                "tool": self.tool,
-                "decision": self.decision,
-                "risk_score": self.risk_score,
-                "explanation": self.explanation,
-                "policy_ids": self.policy_ids,
-                "agent_id": self.agent_id,
-                "session_id": self.session_id,
-                "user_id": self.user_id,
-                "channel": self.channel,
-                "chain_pattern": self.chain_pattern,
-                "timestamp": self.timestamp,
-            }
-        )
+        return json_codec.dumps(self._payload())
+
+    def to_json_bytes(self) -> bytes:
+        """Encoded payload as bytes, ready to write to a stream without a re-encode."""
+        return json_codec.dumps_bytes(self._payload())
+
+    def sse_frame(self) -> bytes:
+        """The complete SSE message for this event, encoded on first use.
+
+        Every subscriber is sent the same frame, so an event is serialised
+        once however many clients are connected.
+        """
+        if self._frame is None:
+            self._frame = (
+                b"event: " + self.event_type.encode()
+                + b"\ndata: " + self.to_json_bytes() + b"\n\n"
+            )
+        return self._frame
+
+    def _payload(self) -> Dict[str, Any]:
+        return {
+            "event": self.event_type,
+            "tool": self.tool,
+            "decision": self.decision,
+            "risk_score": self.risk_score,
+            "explanation": self.explanation,
+            "policy_ids": self.policy_ids,
+            "agent_id": self.agent_id,
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "channel": self.channel,
+            "chain_pattern": self.chain_pattern,
+            "timestamp": self.timestamp,
+        }
 
 
 class EventBus:
     """Simple broadcast pub/sub using per-subscriber asyncio queues."""
 
-    def __init__(self, max_subscribers: int = 500) -> None:
+    def __init__(self, max_subscribers: int = 500, outbox_size: int = 10_000) -> None:
         self._subscribers: set[asyncio.Queue[ActionEvent]] = set()
         self._max_subscribers = max_subscribers
+        self._outbox_size = outbox_size
+        self._outbox: asyncio.Queue[ActionEvent] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._drain_task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background fan-out task on the running event loop."""
+        if self._drain_task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._outbox = asyncio.Queue(maxsize=self._outbox_size)
+        self._drain_task = self._loop.create_task(self._drain())
+
+    async def stop(self) -> None:
+        """Stop the fan-out task; later publishes are delivered inline."""
+        task, self._drain_task = self._drain_task, None
+        self._outbox = None
+        self._loop = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _drain(self) -> None:
+        outbox = self._outbox
+        while True:
+            event = await outbox.get()
+            self._fanout(event)
+
+    def _enqueue(self, event: ActionEvent) -> None:
+        outbox = self._outbox
+        if outbox is None:
+            self._fanout(event)
+            return
+        if outbox.full():
+            outbox.get_nowait()  # drop oldest — live view favours fresh events
+        outbox.put_nowait(event)
 
     def subscribe(self) -> asyncio.Queue[ActionEvent]:
         """Register a new subscriber. Returns the queue to read from.
@@ -80,9 +143,23 @@ class EventBus:
     def publish(self, event: ActionEvent) -> None:
         """Broadcast an event to all connected subscribers.
 
-        Non-blocking: if a subscriber's queue is full the event is dropped
-        (the client can catch up via the REST endpoint).
+        Safe to call from any thread. Non-blocking: if a subscriber's queue is
+        full the event is dropped (the client can catch up via the REST endpoint).
         """
+        loop = self._loop
+        if loop is None:
+            self._fanout(event)
+            return
+        try:
+            loop.call_soon_threadsafe(self._enqueue, event)
+        except RuntimeError:
+            # Loop already closed (shutdown) — deliver inline
+            self._fanout(event)
+
+    def _fanout(self, event: ActionEvent) -> None:
+        if not self._subscribers:
+            return
+        event.sse_frame()  # encode once here, not in each subscriber's stream
         for q in list(self._subscribers):
             try:
                 q.put_nowait(event)
@@ -0,0 +1,64 @@
+"""
+json_codec.py — Fast JSON encode/decode with a stdlib fallback
+===============================================================
+Uses orjson when it is installed (it is in requirements.txt) and falls back
+to the standard library otherwise, so a bare checkout still runs.
+
+    dumps(obj)        -> str    (for TEXT columns)
+    dumps_bytes(obj)  -> bytes  (for response bodies / streams)
+    loads(s)          -> object (accepts str or bytes)
+    raw(s)            -> object embedding stored JSON text in a later dumps()
+
+``JSONResponse`` is the app-wide default response class.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse as _StdJSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — exercised only without orjson
+    orjson = None
+
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=_OPTS).decode()
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_OPTS)
+
+    loads = orjson.loads
+else:
+    def _default(obj: Any) -> Any:
+        # Match orjson's native handling of date/datetime
+        if isinstance(obj, (date, datetime)):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_default)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+    loads = json.loads
+
+
+if orjson is not None and hasattr(orjson, "Fragment"):  # orjson >= 3.10
+    raw = orjson.Fragment
+else:
+    raw = loads  # no splicing available — parse so it re-encodes the same
+
+
+class JSONResponse(_StdJSONResponse):
+    """JSONResponse rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import sys
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +11,8 @@ from slowapi.errors import RateLimitExceeded
 
 from .config import settings
 from .database import Base, engine
+from .event_bus import action_bus
+from .json_codec import JSONResponse
 from .rate_limit import limiter
 from .api import routes_actions, routes_policies, routes_summary, routes_admin, routes_surge, routes_stream, routes_traces, routes_notifications, routes_verify, routes_conversations, routes_clauses
 from .auth.routes_auth import router as auth_router
@@ -91,6 +94,17 @@ def _run_migrations() -> None:
         ("action_logs", "conversation_id", "ix_action_logs_conversation_id"),
         ("action_logs", "turn_id", "ix_action_logs_turn_id"),
         ("action_logs", "chain_pattern", "ix_action_logs_chain_pattern"),
+        ("action_logs", "conversation_id, created_at", "ix_action_logs_conversation_created"),
+        ("conversation_turns", "conversation_id, created_at", "ix_conversation_turns_conversation_created"),
+        ("action_logs", "agent_id, created_at", "ix_action_logs_agent_created"),
+        ("action_logs", "tool, created_at", "ix_action_logs_tool_created"),
+        ("action_logs", "decision, created_at", "ix_action_logs_decision_created"),
+        ("action_logs", "decision, tool", "ix_action_logs_decision_tool"),
+        ("conversation_turns", "agent_id, created_at", "ix_conversation_turns_agent_created"),
+        ("policies", "is_active, policy_id", "ix_policies_active_policy_id"),
+        ("policy_audit_log", "policy_id, created_at", "ix_policy_audit_policy_created"),
+        ("policy_audit_log", "action, created_at", "ix_policy_audit_action_created"),
+        ("policy_audit_log", "username, created_at", "ix_policy_audit_username_created"),
     ]
     is_pg = "postgresql" in settings.database_url
     with engine.connect() as conn:
@@ -123,6 +137,16 @@ try:
 except Exception as exc:
     logging.getLogger("governor.clauses").warning("Clause seeding failed: %s", exc)
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # SSE fan-out runs off the request path once the loop is up
+    action_bus.start()
+    try:
+        yield
+    finally:
+        await action_bus.stop()
+
+
 app = FastAPI(
     title="OpenClaw Governor",
     version="0.4.0",
@@ -133,6 +157,8 @@ app = FastAPI(
     ),
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=_lifespan,
+    default_response_class=JSONResponse,
 )
 
 # Rate limiting
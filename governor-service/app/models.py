@@ -1,14 +1,39 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import Integer, String, DateTime, Text, Boolean, Float
+from sqlalchemy import Integer, String, DateTime, Text, Boolean, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from .database import Base
 
 
+class StringList(TypeDecorator):
+    """List of strings stored as a JSON array in a TEXT column.
+
+    Rows written before the switch hold comma-separated text; those are still
+    read back as lists, so no data migration is needed.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return json.dumps(list(value))
+
+    def process_result_value(self, value, dialect):
+        if not value:
+            return []
+        if value[0] == "[":
+            return json.loads(value)
+        return [p for p in value.split(",") if p]
+
+
 class ActionLog(Base):
     """Persisted record of every evaluated action."""
 
@@ -40,16 +65,31 @@ class ActionLog(Base):
     decision: Mapped[str] = mapped_column(String(32), index=True)
     risk_score: Mapped[int] = mapped_column(Integer)
     explanation: Mapped[str] = mapped_column(Text)
-    policy_ids: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # comma-separated
+    policy_ids: Mapped[List[str]] = mapped_column(StringList, nullable=True)  # JSON array
 
     # Chain analysis (populated when a behavioural attack-chain pattern is detected)
     chain_pattern: Mapped[Optional[str]] = mapped_column(String(128), nullable=True, index=True)
 
+    __table_args__ = (
+        # Ordered scan for the conversation timeline
+        Index("ix_action_logs_conversation_created", "conversation_id", "created_at"),
+        # Filtered, newest-first listings (GET /actions?agent_id=|tool=|decision=)
+        Index("ix_action_logs_agent_created", "agent_id", "created_at"),
+        Index("ix_action_logs_tool_created", "tool", "created_at"),
+        Index("ix_action_logs_decision_created", "decision", "created_at"),
+        # Top blocked tool (GROUP BY tool WHERE decision='block') from the index alone
+        Index("ix_action_logs_decision_tool", "decision", "tool"),
+    )
+
 
 class PolicyModel(Base):
     """Dynamically managed policy stored in DB (supplements base_policies.yml)."""
 
     __tablename__ = "policies"
+    __table_args__ = (
+        # Active-policy loads (evaluator cache, GET /policies?active_only=true)
+        Index("ix_policies_active_policy_id", "is_active", "policy_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     policy_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)
@@ -180,6 +220,12 @@ class PolicyAuditLog(Base):
     """
 
     __tablename__ = "policy_audit_log"
+    __table_args__ = (
+        # Filtered, newest-first trail (GET /policies/audit/trail?policy_id=|action=|username=)
+        Index("ix_policy_audit_policy_created", "policy_id", "created_at"),
+        Index("ix_policy_audit_action_created", "action", "created_at"),
+        Index("ix_policy_audit_username_created", "username", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -311,6 +357,13 @@ class ConversationTurn(Base):
     prompt_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     completion_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
+    __table_args__ = (
+        # Ordered scan for the conversation timeline
+        Index("ix_conversation_turns_conversation_created", "conversation_id", "created_at"),
+        # Filtered, newest-first listings (GET /conversations/turns?agent_id=)
+        Index("ix_conversation_turns_agent_created", "agent_id", "created_at"),
+    )
+
 
 class VerificationLog(Base):
     """Post-execution verification record — tracks compliance of actual tool results."""
@@ -327,7 +327,7 @@ def _hydrate_impact_engine(engine) -> None:
                         risk_score=r.risk_score or 0,
                         agent_id=r.agent_id or "anonymous",
                         session_id=r.session_id or "default",
-                        policy_ids=r.policy_ids.split(",") if r.policy_ids else [],
+                        policy_ids=r.policy_ids,
                         chain_pattern=r.chain_pattern,
                         explanation=r.explanation or "",
                     ))
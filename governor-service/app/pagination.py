@@ -0,0 +1,89 @@
+"""
+pagination.py — Keyset (cursor) pagination helpers
+===================================================
+List endpoints ordered by ``created_at DESC, id DESC`` accept an opaque
+``cursor`` query parameter as an alternative to ``offset``. The cursor
+encodes the ``(created_at, id)`` of the last row already seen, so the next
+page is a range seek on the index instead of scanning and discarding
+``offset`` rows.
+
+The cursor for the next page is returned in the ``X-Next-Cursor`` response
+header (absent on the last page), which keeps the list response bodies
+unchanged for existing clients.
+
+The conversation timeline pages oldest-first over turns *and* actions, so
+its cursor also carries the entry type (ids are only unique per table).
+"""
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Select, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _unb64(cursor: str) -> str:
+    return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    return _b64(f"{created_at.isoformat()}|{row_id}")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by ``encode_cursor``. Raises 400 if malformed."""
+    try:
+        ts, row_id = _unb64(cursor).rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def encode_timeline_cursor(created_at: datetime, kind: str, row_id: int) -> str:
+    return _b64(f"{created_at.isoformat()}|{kind}|{row_id}")
+
+
+def decode_timeline_cursor(cursor: str) -> tuple[datetime, str, int]:
+    """Decode a cursor produced by ``encode_timeline_cursor``. Raises 400 if malformed."""
+    try:
+        ts, kind, row_id = _unb64(cursor).rsplit("|", 2)
+        return datetime.fromisoformat(ts), kind, int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def keyset_page(stmt: Select, created_col: Any, id_col: Any, cursor: str | None, limit: int) -> Select:
+    """Order ``stmt`` newest-first and, given a cursor, seek past it.
+
+    Fetches ``limit + 1`` rows so ``split_page`` can tell whether another
+    page exists.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            created_col < created_at,
+            (created_col == created_at) & (id_col < row_id),
+        ))
+    return stmt.order_by(created_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int) -> tuple[Sequence[Any], Optional[str]]:
+    """Trim the look-ahead row; return the page and the next cursor (None on the last page)."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+def cursor_headers(next_cursor: Optional[str]) -> Optional[dict[str, str]]:
+    """Response headers publishing ``next_cursor``, if there is one."""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+
@@ -4,9 +4,8 @@ import logging
 import re
 import time
 import unicodedata
-from typing import List
 
-from .loader import Policy, load_all_policies
+from .loader import load_policy_set
 from ..schemas import ActionInput, ActionDecision, TraceStep
 from ..state import is_kill_switch_enabled
 from ..neuro.risk_estimator import estimate_neural_risk
@@ -269,13 +268,16 @@ def evaluate_action(action: ActionInput) -> ActionDecision:
 
     # ── Layer 4: Policy engine ────────────────────────────────────────
     t = time.perf_counter()
-    policies: List[Policy] = load_all_policies()
+    # One snapshot for both the walk and the "checked N" count below
+    policy_set = load_policy_set()
+    policies = policy_set.policies
     matched: list[str] = []
     risk_score = 0
     decision = "allow"
     explanation_parts: list[str] = []
 
-    for p in policies:
+    # Policies filtered to a different tool can't match — skip them up front
+    for p in policy_set.for_tool(action.tool):
         if not p.matches(action):
             continue
         matched.append(p.id)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import json
 import re
+import threading
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
+from sqlalchemy import event
 
+from .. import json_codec
 from ..config import settings
 from ..schemas import ActionInput
 
@@ -17,13 +20,13 @@ from ..schemas import ActionInput
 _REGEX_TIMEOUT_S = 0.05
 
 
-def _safe_regex_search(pattern: str, text: str) -> bool:
+def _safe_regex_search(pattern: str, text: str, flags: int = 0) -> bool:
     """Execute regex search with compiled+cached pattern. Returns True if match found.
 
     Protects against ReDoS by pre-compiling patterns and catching errors.
     """
     try:
-        compiled = _get_compiled_regex(pattern)
+        compiled = _get_compiled_regex(pattern, flags)
         if compiled is None:
             return False
         return compiled.search(text) is not None
@@ -31,27 +34,72 @@ def _safe_regex_search(pattern: str, text: str) -> bool:
         return False
 
 
-# LRU-style compiled regex cache (bounded)
-_compiled_regex_cache: Dict[str, Optional[re.Pattern]] = {}
+# LRU-style compiled regex cache (bounded), keyed by (pattern, flags)
+_compiled_regex_cache: Dict[Tuple[str, int], Optional[re.Pattern]] = {}
 _MAX_REGEX_CACHE = 500
 
 
-def _get_compiled_regex(pattern: str) -> Optional[re.Pattern]:
+def _get_compiled_regex(pattern: str, flags: int = 0) -> Optional[re.Pattern]:
     """Compile and cache a regex pattern. Returns None on compile error."""
-    if pattern in _compiled_regex_cache:
-        return _compiled_regex_cache[pattern]
+    key = (pattern, flags)
+    if key in _compiled_regex_cache:
+        return _compiled_regex_cache[key]
+    try:
+        compiled = re.compile(pattern, flags)
+    except re.error:
+        compiled = None
+    _store_compiled_regex(key, compiled)
+    return compiled
+
+
+def regex_flags(match: Dict[str, Any]) -> int:
+    r"""Compile flags for a policy's regexes.
+
+    ``"regex_ascii": true`` in ``match_json`` opts into ``re.ASCII`` — smaller
+    character classes and faster matching for policies that only target
+    ASCII paths/URLs. Off by default: in ASCII mode ``\s``/``\w`` stop
+    matching Unicode whitespace and letters, which block rules may rely on.
+    """
+    return re.ASCII if match.get("regex_ascii") is True else 0
+
+
+def _store_compiled_regex(key: Tuple[str, int], compiled: Optional[re.Pattern]) -> None:
     if len(_compiled_regex_cache) >= _MAX_REGEX_CACHE:
         # Evict oldest entries
         keys = list(_compiled_regex_cache.keys())
         for k in keys[:100]:
             del _compiled_regex_cache[k]
-    try:
-        compiled = re.compile(pattern)
-        _compiled_regex_cache[pattern] = compiled
-        return compiled
-    except re.error:
-        _compiled_regex_cache[pattern] = None
-        return None
+    _compiled_regex_cache[key] = compiled
+
+
+def compile_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile ``pattern`` through the evaluation cache, raising ``re.error`` if invalid.
+
+    Used by policy validation, so a pattern checked on save is already
+    compiled when the evaluator first needs it. An edited regex is simply a
+    new key; the old one ages out with normal eviction.
+    """
+    compiled = _compiled_regex_cache.get((pattern, flags))
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+        _store_compiled_regex((pattern, flags), compiled)
+    return compiled
+
+
+@lru_cache(maxsize=2048)
+def _decode_match_cached(raw: str) -> Dict[str, Any]:
+    return json_codec.loads(raw)
+
+
+def decode_match_json(raw: Optional[str]) -> Dict[str, Any]:
+    """Parse a stored policy ``match_json`` string.
+
+    Memoised by the stored text — an edited policy is a new key, so no
+    invalidation is needed. Returns a copy callers may mutate.
+    """
+    if not raw:
+        return {}
+    return dict(_decode_match_cached(raw))
 
 
 @dataclass
@@ -75,14 +123,14 @@ class Policy:
         url_regex = m.get("url_regex")
         if url_regex and action.tool == "http_request":
             url = str(action.args.get("url", ""))
-            if not _safe_regex_search(url_regex, url):
+            if not _safe_regex_search(url_regex, url, regex_flags(m)):
                 return False
 
         # Generic args regex against flattened payload string
         args_regex = m.get("args_regex")
         if args_regex:
             flat = f"{action.tool} {action.args} {action.context}".lower()
-            if not _safe_regex_search(args_regex, flat):
+            if not _safe_regex_search(args_regex, flat, regex_flags(m)):
                 return False
 
         # If the policy has a tool match but no regex constraints → matched
@@ -136,7 +184,7 @@ def load_db_policies() -> List[Policy]:
                 id=row.policy_id,
                 description=row.description,
                 severity=row.severity,
-                match=json.loads(row.match_json or "{}"),
+                match=decode_match_json(row.match_json),
                 action=row.action,
             )
             for row in rows
@@ -147,28 +195,88 @@ def load_db_policies() -> List[Policy]:
 # Cached loader — avoids re-reading YAML + DB on every evaluation
 # ---------------------------------------------------------------------------
 
-_policy_cache: List[Policy] = []
+@dataclass(frozen=True)
+class PolicySet:
+    """One loaded generation of policies plus its per-tool index.
+
+    Built and swapped as a unit, so a caller holding a ``PolicySet`` never
+    sees the list from one reload and the index from another.
+    """
+    policies: List[Policy]
+    by_tool: Dict[Optional[str], List[Policy]]
+
+    def for_tool(self, tool: str) -> List[Policy]:
+        """Policies whose ``tool`` filter admits ``tool`` — the only ones worth
+        calling ``matches()`` on."""
+        return self.by_tool.get(tool, self.by_tool.get(None, []))
+
+
+_policy_set = PolicySet([], {})
 _policy_cache_ts: float = 0.0
+_policy_cache_gen: int = 0          # bumped by every invalidation
+_policy_reload_lock = threading.Lock()
 
 
-def load_all_policies() -> List[Policy]:
-    """Return base (YAML) policies followed by dynamic (DB) policies.
+def load_policy_set() -> PolicySet:
+    """Return the current :class:`PolicySet` — base (YAML) policies followed
+    by dynamic (DB) policies, with their per-tool index.
 
     Results are cached for ``settings.policy_cache_ttl_seconds`` (default 10s)
-    to avoid hitting disk + DB on every single action evaluation.
+    to avoid hitting disk + DB on every single action evaluation. After an
+    invalidation only one caller rebuilds; concurrent callers wait for it
+    and share the result.
     """
-    global _policy_cache, _policy_cache_ts
+    global _policy_set, _policy_cache_ts
+
+    cached = _policy_set
+    if cached.policies and (time.monotonic() - _policy_cache_ts) < settings.policy_cache_ttl_seconds:
+        return cached
 
-    now = time.monotonic()
-    if _policy_cache and (now - _policy_cache_ts) < settings.policy_cache_ttl_seconds:
-        return _policy_cache
+    with _policy_reload_lock:
+        now = time.monotonic()
+        if _policy_set.policies and (now - _policy_cache_ts) < settings.policy_cache_ttl_seconds:
+            return _policy_set  # rebuilt by the caller we waited on
+        gen = _policy_cache_gen
+        policies = load_base_policies() + load_db_policies()
+        _policy_set = PolicySet(policies, _index_by_tool(policies))
+        # An invalidation that landed mid-rebuild may not be reflected — leave stale
+        _policy_cache_ts = now if gen == _policy_cache_gen else 0.0
+        return _policy_set
 
-    _policy_cache = load_base_policies() + load_db_policies()
-    _policy_cache_ts = now
-    return _policy_cache
+
+def load_all_policies() -> List[Policy]:
+    """Return base (YAML) policies followed by dynamic (DB) policies (cached)."""
+    return load_policy_set().policies
+
+
+def _index_by_tool(policies: List[Policy]) -> Dict[Optional[str], List[Policy]]:
+    """Per tool, the policies that can match it: its own plus tool-agnostic ones.
+
+    Order follows ``policies`` so match order is unchanged. ``None`` holds
+    the tool-agnostic policies, used for tools no policy names.
+    """
+    def _tool(p: Policy) -> Any:
+        return p.match.get("tool") or None
+
+    tools = {t for t in map(_tool, policies) if isinstance(t, str)}
+    index: Dict[Optional[str], List[Policy]] = {
+        t: [p for p in policies if _tool(p) in (None, t)] for t in tools
+    }
+    index[None] = [p for p in policies if _tool(p) is None]
+    return index
 
 
 def invalidate_policy_cache() -> None:
-    """Force the next load_all_policies() call to reload from source."""
-    global _policy_cache_ts
+    """Force the next load_policy_set() call to reload from source.
+
+    Cheap and lazy: a burst of invalidations costs a single rebuild, on the
+    next read.
+    """
+    global _policy_cache_ts, _policy_cache_gen
+    _policy_cache_gen += 1
     _policy_cache_ts = 0.0
+
+
+def invalidate_policy_cache_on_commit(session) -> None:
+    """Invalidate once ``session`` commits, so a reload can't cache the pre-commit state."""
+    event.listen(session, "after_commit", lambda _s: invalidate_policy_cache(), once=True)
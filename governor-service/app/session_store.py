@@ -73,7 +73,7 @@ def get_agent_history(
         HistoryEntry(
             tool=row.tool,
             decision=row.decision,
-            policy_ids=[p for p in (row.policy_ids or "").split(",") if p],
+            policy_ids=row.policy_ids,
             ts=row.created_at,
             session_id=row.session_id,
         )
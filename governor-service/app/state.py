@@ -53,6 +53,15 @@ def set_kill_switch(enabled: bool) -> None:
 
 def is_kill_switch_enabled() -> bool:
     """Returns True if the global kill switch is currently active."""
+    # Checked on every evaluation: once loaded, the cached bool is read
+    # without taking the lock (a single reference read is atomic).
+    cached = _kill_switch_cache
+    if cached is not None:
+        return cached
+    return _load_once()
+
+
+def _load_once() -> bool:
     global _kill_switch_cache
     with _state_lock:
         if _kill_switch_cache is None:
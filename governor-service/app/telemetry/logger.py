@@ -43,7 +43,7 @@ def log_action(action: ActionInput, decision: ActionDecision) -> None:
             decision=decision.decision,
             risk_score=decision.risk_score,
             explanation=decision.explanation,
-            policy_ids=",".join(decision.policy_ids),
+            policy_ids=decision.policy_ids,
             # Chain analysis
             chain_pattern=decision.chain_pattern,
         )
@@ -136,6 +136,12 @@ class TestBatchIngest:
         assert data["created"] == 3
         assert len(data["ids"]) == 3
 
+        # ids come back in payload order
+        for i, turn_id in enumerate(data["ids"]):
+            got = client.get(f"/conversations/turns/{turn_id}", headers=_headers(admin_token))
+            assert got.json()["turn_index"] == i
+            assert got.json()["prompt"] == f"Turn {i}"
+
     def test_batch_empty_rejected(self, admin_token):
         resp = client.post(
             "/conversations/turns/batch",
@@ -178,6 +184,30 @@ class TestListTurns:
         resp = client.get("/conversations/turns")
         assert resp.status_code in (401, 403)
 
+    def test_cursor_pagination(self, admin_token):
+        cid = "conv-cursor-pages"
+        for i in range(5):
+            _create_turn(admin_token, conversation_id=cid, turn_index=i)
+
+        seen: list[int] = []
+        cursor = None
+        for _ in range(5):
+            url = f"/conversations/turns?conversation_id={cid}&limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            resp = client.get(url, headers=_headers(admin_token))
+            assert resp.status_code == 200
+            seen += [t["turn_index"] for t in resp.json()]
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert seen == [4, 3, 2, 1, 0]
+
+    def test_invalid_cursor_rejected(self, admin_token):
+        resp = client.get("/conversations/turns?cursor=not-a-cursor", headers=_headers(admin_token))
+        assert resp.status_code == 400
+
 
 # ---------------------------------------------------------------------------
 # GET /conversations/turns/{turn_id}
@@ -311,6 +341,66 @@ class TestTimeline:
         assert "turn" in types
         assert "action" in types
 
+    def test_timeline_ordered_and_limited(self, admin_token):
+        cid = "conv-timeline-order"
+        for i in range(3):
+            _create_turn(admin_token, conversation_id=cid, turn_index=i)
+            client.post(
+                "/actions/evaluate",
+                json={
+                    "tool": "read_file",
+                    "args": {"path": f"/tmp/{i}.txt"},
+                    "context": {"agent_id": "agent-tl-order", "conversation_id": cid},
+                },
+                headers=_headers(admin_token),
+            )
+
+        resp = client.get(f"/conversations/{cid}/timeline", headers=_headers(admin_token))
+        timeline = resp.json()["timeline"]
+        assert len(timeline) == 6
+        stamps = [e["timestamp"] for e in timeline]
+        assert stamps == sorted(stamps)
+        assert [e["turn_index"] for e in timeline if e["type"] == "turn"] == [0, 1, 2]
+
+        assert resp.json()["truncated"] is False
+        assert resp.json()["next_cursor"] is None
+
+        resp = client.get(f"/conversations/{cid}/timeline?limit=2", headers=_headers(admin_token))
+        data = resp.json()
+        assert len(data["timeline"]) == 2
+        # Counts are conversation totals, not the size of the page
+        assert (data["turns"], data["actions"]) == (3, 3)
+        assert data["truncated"] is True
+        assert resp.headers["X-Next-Cursor"] == data["next_cursor"]
+
+        paged = data["timeline"]
+        while data["next_cursor"]:
+            resp = client.get(
+                f"/conversations/{cid}/timeline",
+                params={"limit": 4, "cursor": data["next_cursor"]},
+                headers=_headers(admin_token),
+            )
+            data = resp.json()
+            paged += data["timeline"]
+        assert paged == timeline
+        assert "X-Next-Cursor" not in resp.headers
+
+    def test_timeline_stream_leads_with_paging_fields(self, admin_token):
+        cid = "conv-timeline-stream"
+        for i in range(2):
+            _create_turn(admin_token, conversation_id=cid, turn_index=i)
+        resp = client.get(f"/conversations/{cid}/timeline?limit=1", headers=_headers(admin_token))
+        head = resp.content.split(b'"timeline":', 1)[0]
+        assert b'"truncated":true' in head
+        assert b'"next_cursor":' in head
+
+    def test_timeline_invalid_cursor(self, admin_token):
+        resp = client.get(
+            "/conversations/conv-timeline-order/timeline?cursor=bogus",
+            headers=_headers(admin_token),
+        )
+        assert resp.status_code == 400
+
     def test_timeline_empty_conversation(self, admin_token):
         resp = client.get("/conversations/nonexistent-conv/timeline", headers=_headers(admin_token))
         assert resp.status_code == 200
@@ -340,6 +430,26 @@ class TestConversationList:
         assert len(found) == 1
         assert found[0]["turn_count"] >= 2
 
+    def test_list_conversations_action_count(self, admin_token):
+        cid = "conv-list-actions"
+        _create_turn(admin_token, conversation_id=cid, agent_id="agent-list-actions")
+        for _ in range(2):
+            client.post(
+                "/actions/evaluate",
+                json={
+                    "tool": "read_file",
+                    "args": {"path": "/tmp/a.txt"},
+                    "context": {"agent_id": "agent-list-actions", "conversation_id": cid},
+                },
+                headers=_headers(admin_token),
+            )
+
+        resp = client.get("/conversations?agent_id=agent-list-actions", headers=_headers(admin_token))
+        assert resp.status_code == 200
+        found = [c for c in resp.json() if c["conversation_id"] == cid]
+        assert len(found) == 1
+        assert found[0]["action_count"] == 2
+
     def test_list_conversations_filter_agent(self, admin_token):
         _create_turn(admin_token, conversation_id="conv-agent-filter", agent_id="agent-unique-filter")
         resp = client.get("/conversations?agent_id=agent-unique-filter", headers=_headers(admin_token))
@@ -350,3 +460,54 @@ class TestConversationList:
     def test_list_conversations_requires_auth(self):
         resp = client.get("/conversations")
         assert resp.status_code in (401, 403)
+
+
+# ---------------------------------------------------------------------------
+# Decrypt cache
+# ---------------------------------------------------------------------------
+
+class TestDecryptCache:
+
+    @pytest.fixture
+    def keyed(self, monkeypatch):
+        from cryptography.fernet import Fernet
+        from app import encryption
+
+        key = Fernet.generate_key().decode()
+        monkeypatch.setattr(encryption, "_fernet", Fernet(key.encode()))
+        monkeypatch.setattr(encryption, "encrypt_value", encryption._encrypt)
+        monkeypatch.setattr(encryption, "decrypt_value", encryption._decrypt)
+        encryption._decrypt_memo.cache_clear()
+        yield encryption, key
+        encryption._decrypt_memo.cache_clear()
+
+    def test_passthrough_is_not_cached(self):
+        from app import encryption
+
+        if encryption.decrypt_value is not encryption._passthrough:
+            pytest.skip("encryption key configured")
+        before = encryption._decrypt_memo.cache_info().currsize
+        assert encryption.decrypt_cached("plain text") == "plain text"
+        assert encryption._decrypt_memo.cache_info().currsize == before
+        with pytest.raises(RuntimeError):
+            encryption.rotate_encryption_key("unused")
+
+    def test_only_short_values_cached(self, keyed):
+        encryption, _ = keyed
+        short = encryption.encrypt_value("short secret")
+        large = encryption.encrypt_value("x" * 10_000)
+        assert encryption.decrypt_cached(short) == "short secret"
+        assert encryption.decrypt_cached(large) == "x" * 10_000
+        assert encryption._decrypt_memo.cache_info().currsize == 1
+
+    def test_rotation_clears_cache_and_keeps_old_values_readable(self, keyed):
+        from cryptography.fernet import Fernet
+
+        encryption, old_key = keyed
+        token = encryption.encrypt_value("before rotation")
+        assert encryption.decrypt_cached(token) == "before rotation"
+
+        encryption.rotate_encryption_key(Fernet.generate_key().decode(), old_key)
+        assert encryption._decrypt_memo.cache_info().currsize == 0
+        assert encryption.decrypt_cached(token) == "before rotation"
+        assert encryption.decrypt_value(encryption.encrypt_value("after")) == "after"
@@ -426,6 +426,34 @@ class TestNoEscalationOnAllow:
         assert len(resp.json()) == 0
         _cleanup_escalation_tables()
 
+    def test_allow_reports_auto_ks_it_triggered(self, admin_token):
+        """The auto-KS check runs inline for allows too, so the response says so."""
+        from app.state import set_kill_switch
+
+        _cleanup_escalation_tables()
+        with db_session() as session:
+            # Risk threshold 0: any recent history trips the kill switch
+            session.add(EscalationConfig(
+                scope="*", auto_ks_enabled=True, auto_ks_risk_threshold=0,
+                auto_ks_window_size=1, notify_on_auto_ks=False,
+            ))
+        try:
+            resp = client.post(
+                "/actions/evaluate",
+                json={
+                    "tool": "http_request",
+                    "args": {"url": "http://localhost/health"},
+                    "context": {"agent_id": "safe-agent"},
+                },
+                headers=_headers(admin_token),
+            )
+            data = resp.json()
+            assert data["decision"] == "allow"
+            assert data["auto_ks_triggered"] is True
+        finally:
+            set_kill_switch(False)
+            _cleanup_escalation_tables()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Review expiry config field
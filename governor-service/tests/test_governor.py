@@ -245,6 +245,63 @@ def test_policy_cache_invalidation():
     assert len(policies_1) == len(policies_2)
 
 
+def test_policy_set_is_one_snapshot():
+    """The list and the per-tool index always come from the same reload."""
+    from app.policies import loader
+
+    first = loader.load_policy_set()
+    loader.invalidate_policy_cache()
+    second = loader.load_policy_set()
+    assert second is not first
+    for snapshot in (first, second):
+        for p in snapshot.for_tool("shell"):
+            assert any(p is q for q in snapshot.policies)
+
+
+def test_policy_cache_invalidated_only_after_commit():
+    from app.database import db_session
+    from app.policies import loader
+
+    first = loader.load_all_policies()
+    with db_session() as session:
+        loader.invalidate_policy_cache_on_commit(session)
+        # Not yet committed — readers still get the cached list
+        assert loader.load_all_policies() is first
+    assert loader.load_all_policies() is not first
+
+
+def test_policy_regex_ascii_opt_in():
+    from app.policies.loader import Policy
+
+    action = _action("shell", {"cmd": "café"})
+    unicode_policy = Policy("u", "", 50, {"tool": "shell", "args_regex": r"caf\w\b"}, "block")
+    ascii_policy = Policy("a", "", 50, {"tool": "shell", "args_regex": r"caf\w\b", "regex_ascii": True}, "block")
+    assert unicode_policy.matches(action)
+    assert not ascii_policy.matches(action)
+
+
+def test_policy_tool_index_preserves_order():
+    from app.policies.loader import Policy, _index_by_tool
+
+    a = Policy("a", "", 1, {"tool": "shell"}, "block")
+    b = Policy("b", "", 1, {"args_regex": "x"}, "review")
+    c = Policy("c", "", 1, {"tool": "http_request"}, "block")
+    d = Policy("d", "", 1, {"tool": "shell", "args_regex": "y"}, "block")
+    index = _index_by_tool([a, b, c, d])
+    assert index["shell"] == [a, b, d]
+    assert index["http_request"] == [b, c]
+    assert index[None] == [b]
+
+
+def test_no_duplicate_routes():
+    """Each (method, path) is registered once — duplicates lengthen route matching."""
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            assert key not in seen, f"duplicate route {key}"
+            seen.add(key)
+
 # ---------------------------------------------------------------------------
 # SURGE governance policies
 # ---------------------------------------------------------------------------
@@ -283,6 +340,35 @@ def test_governance_receipt_creation():
     assert receipt.decision == "block"
 
 
+def test_governance_receipt_digest_payload_is_stable():
+    """Digests already issued must still verify — the payload format is fixed."""
+    from hashlib import sha256
+    from app.api.routes_surge import _compute_digest
+
+    payload = "ocg-1|2026-01-01T00:00:00+00:00|shell|block|95|a,b"
+    assert _compute_digest(
+        "ocg-1", "2026-01-01T00:00:00+00:00", "shell", "block", 95, ["a", "b"],
+    ) == sha256(payload.encode()).hexdigest()
+    assert _compute_digest("ocg-1", "t", "shell", "allow", 0, []) == sha256(b"ocg-1|t|shell|allow|0|").hexdigest()
+
+
+def test_governance_receipt_digest_blake2b_opt_in(monkeypatch):
+    from hashlib import blake2b
+    from app.api.routes_surge import _compute_digest
+    from app.config import settings
+
+    args = ("ocg-1", "t", "shell", "block", 95, ["a"])
+    payload = b"ocg-1|t|shell|block|95|a"
+    monkeypatch.setattr(settings, "surge_receipt_digest", "blake2b")
+    assert _compute_digest(*args) == blake2b(payload, digest_size=20).hexdigest()
+    assert len(_compute_digest(*args)) == 40
+
+    monkeypatch.setattr(settings, "surge_receipt_digest_key", "k")
+    keyed = _compute_digest(*args)
+    assert keyed == blake2b(payload, digest_size=20, key=b"k").hexdigest()
+    assert keyed != blake2b(payload, digest_size=20).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # SURGE tiered fee computation
 # ---------------------------------------------------------------------------
@@ -375,6 +461,14 @@ def test_surge_receipts_list_endpoint(admin_token):
     assert isinstance(data, list)
 
 
+def test_surge_receipts_list_page_is_bounded(admin_token):
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert client.get("/surge/receipts?limit=201", headers=headers).status_code == 422
+    assert client.get("/surge/receipts?offset=-1", headers=headers).status_code == 422
+    assert client.get("/surge/receipts?limit=200", headers=headers).status_code == 200
+
+
 def test_surge_wallet_lifecycle(admin_token):
     """Test wallet creation, retrieval, and top-up."""
     client = TestClient(app)
@@ -460,6 +554,32 @@ def test_surge_policy_stake_lifecycle(admin_token):
     assert resp.json()["status"] == "unstaked"
     assert resp.json()["surge_returned"] == "5.0000"
 
+    # Already gone
+    resp = client.delete("/surge/policies/stake/test-stake-policy", headers=headers)
+    assert resp.status_code == 404
+
+
+def test_surge_status_staked_totals(admin_token):
+    """Status counts active stakes and sums them exactly (no float drift)."""
+    from decimal import Decimal
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    before = client.get("/surge/status", headers=headers).json()
+
+    for pid, amount in (("test-stake-sum-a", "0.1000"), ("test-stake-sum-b", "0.2000")):
+        client.post("/surge/policies/stake", json={
+            "policy_id": pid, "description": "sum", "severity": 10, "match_json": {},
+            "action": "allow", "surge_amount": amount, "wallet_address": "0xSum",
+        }, headers=headers)
+    try:
+        after = client.get("/surge/status", headers=headers).json()
+        assert after["total_staked_policies"] == before["total_staked_policies"] + 2
+        assert Decimal(after["total_surge_staked"]) - Decimal(before["total_surge_staked"]) == Decimal("0.3")
+    finally:
+        for pid in ("test-stake-sum-a", "test-stake-sum-b"):
+            client.delete(f"/surge/policies/stake/{pid}", headers=headers)
+
 
 def test_surge_wallet_deduct_on_receipt():
     """When fee gating is enabled, receipt creation should deduct from wallet."""
@@ -503,3 +623,112 @@ def test_surge_wallet_deduct_on_receipt():
         balance = Decimal(wallet.balance)
         assert balance == Decimal("9.9750")  # 10.0 - 0.025
         assert Decimal(wallet.total_fees_paid) == Decimal("0.0250")
+
+
+def test_surge_wallet_cache_dropped_when_fees_empty_wallet():
+    """A cached 'funded' check must not outlive the fee that empties the wallet."""
+    from fastapi import HTTPException
+    from app.api.routes_surge import check_wallet_balance, create_governance_receipt
+    from app.database import db_session
+    from app.models import SurgeWallet
+    from app.config import settings
+
+    with db_session() as session:
+        session.add(SurgeWallet(
+            wallet_id="test-cache-agent",
+            label="Cache Test",
+            balance="0.0010",
+            total_deposited="0.0010",
+        ))
+
+    original = settings.surge_governance_fee_enabled
+    settings.surge_governance_fee_enabled = True
+    try:
+        check_wallet_balance("test-cache-agent")  # funded → cached
+        create_governance_receipt(
+            tool="read_file",
+            decision="allow",
+            risk_score=0,  # standard tier: 0.001 SURGE
+            policy_ids=[],
+            agent_id="test-cache-agent",
+        )
+        with pytest.raises(HTTPException) as exc:
+            check_wallet_balance("test-cache-agent")
+        assert exc.value.status_code == 402
+    finally:
+        settings.surge_governance_fee_enabled = original
+
+
+def test_action_log_policy_ids_reads_json_and_legacy_csv():
+    """ActionLog.policy_ids round-trips as a list and still reads pre-JSON CSV rows."""
+    from app.models import StringList
+
+    col = StringList()
+    stored = col.process_bind_param(["scope-violation", "shell-dangerous"], None)
+    assert col.process_result_value(stored, None) == ["scope-violation", "shell-dangerous"]
+    assert col.process_result_value("scope-violation,shell-dangerous", None) == [
+        "scope-violation", "shell-dangerous",
+    ]
+    assert col.process_result_value("", None) == []
+    assert col.process_result_value(None, None) == []
+
+
+def test_list_actions_cursor_pages(admin_token):
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    for i in range(3):
+        client.post("/actions/evaluate", json={
+            "tool": "file_read", "args": {"path": f"/tmp/{i}"},
+            "context": {"agent_id": "cursor-agent"},
+        }, headers=headers)
+
+    first = client.get("/actions?agent_id=cursor-agent&limit=2", headers=headers)
+    cursor = first.headers["X-Next-Cursor"]
+    rest = client.get(f"/actions?agent_id=cursor-agent&limit=2&cursor={cursor}", headers=headers)
+    assert "X-Next-Cursor" not in rest.headers
+    ids = [a["id"] for a in first.json() + rest.json()]
+    assert len(ids) == 3 and ids == sorted(ids, reverse=True)
+
+
+def test_moltbook_summary_matches_action_log(admin_token):
+    """The single-pass summary agrees with per-decision counts over action_logs."""
+    from sqlalchemy import func, select
+    from app.database import db_session
+    from app.models import ActionLog
+    from app.api import routes_summary
+
+    routes_summary._summary_cache = None
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    client.post("/actions/evaluate", json={"tool": "shell", "args": {"cmd": "rm -rf /"}}, headers=headers)
+    client.post("/actions/evaluate", json={"tool": "file_read", "args": {"path": "/tmp/x"}}, headers=headers)
+
+    resp = client.get("/summary/moltbook", headers=headers)
+    assert resp.status_code == 200
+    data = resp.json()
+
+    with db_session() as session:
+        def _count(*where):
+            return session.execute(select(func.count(ActionLog.id)).where(*where)).scalar_one()
+
+        assert data["total_actions"] == _count()
+        assert data["blocked"] == _count(ActionLog.decision == "block")
+        assert data["allowed"] == _count(ActionLog.decision == "allow")
+        assert data["under_review"] == _count(ActionLog.decision == "review")
+        assert data["high_risk_count"] == _count(ActionLog.risk_score >= 80)
+    assert data["blocked"] >= 1
+    assert data["total_actions"] >= 2
+
+
+def test_moltbook_summary_cached_between_polls(admin_token):
+    from app.api import routes_summary
+
+    routes_summary._summary_cache = None
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first = client.get("/summary/moltbook", headers=headers)
+    assert first.headers["X-Cache"] == "MISS"
+    client.post("/actions/evaluate", json={"tool": "file_read", "args": {"path": "/tmp/y"}}, headers=headers)
+    second = client.get("/summary/moltbook", headers=headers)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
@@ -125,6 +125,19 @@ class TestCreatePolicy:
         assert resp.status_code == 422
         assert "url_regex" in resp.json()["detail"]
 
+    def test_create_warms_evaluator_regex_cache(self):
+        from app.policies import loader
+
+        pattern = r"warm-cache-\d+"
+        resp = client.post("/policies", json={
+            "policy_id": "test-warm-regex",
+            "description": "warm",
+            "severity": 50,
+            "match_json": {"tool": "shell", "args_regex": pattern},
+            "action": "review",
+        }, headers=_admin_headers())
+        assert resp.status_code == 201
+        assert loader._compiled_regex_cache[(pattern, 0)].pattern == pattern
 
 # ---------------------------------------------------------------------------
 # GET (single + list)
@@ -290,6 +303,23 @@ class TestTogglePolicy:
         resp = client.patch("/policies/test-toggle/toggle", headers=h)
         assert resp.json()["is_active"] is True
 
+    def test_toggle_and_archive_advance_updated_at(self):
+        h = _admin_headers()
+        created = client.post("/policies", json={
+            "policy_id": "test-toggle-stamp",
+            "description": "stamp me",
+            "severity": 50,
+            "match_json": {},
+            "action": "review",
+        }, headers=h).json()
+
+        toggled = client.patch("/policies/test-toggle-stamp/toggle", headers=h).json()
+        assert toggled["updated_at"] > created["updated_at"]
+
+        client.patch("/policies/test-toggle-stamp/toggle", headers=h)
+        archived = client.patch("/policies/test-toggle-stamp/archive", headers=h).json()
+        assert archived["updated_at"] > toggled["updated_at"]
+
     def test_toggle_nonexistent_returns_404(self):
         h = _admin_headers()
         resp = client.patch("/policies/nonexistent-xyz/toggle", headers=h)
@@ -398,6 +428,25 @@ class TestExportPolicies:
         assert resp.status_code == 200
         assert resp.json() == []
 
+    def test_export_spans_multiple_batches(self, monkeypatch):
+        from app.api import routes_policies
+
+        monkeypatch.setattr(routes_policies, "_EXPORT_BATCH", 2)
+        h = _admin_headers()
+        for i in range(5):
+            client.post("/policies", json={
+                "policy_id": f"test-export-batch-{i}",
+                "description": "batch",
+                "severity": 10,
+                "match_json": {"tool": "shell"},
+                "action": "allow",
+            }, headers=h)
+
+        resp = client.get("/policies/export/all", headers=h)
+        assert resp.status_code == 200
+        ids = [p["policy_id"] for p in resp.json()]
+        assert all(f"test-export-batch-{i}" in ids for i in range(5))
+
 
 # ---------------------------------------------------------------------------
 # TEMPLATE
@@ -483,6 +532,45 @@ class TestImportPolicies:
         assert data["created"] == 1
         assert data["skipped"] == 1
 
+    def test_import_skips_duplicates_within_payload(self):
+        h = _admin_headers()
+        payload = {
+            "policies": [
+                {"policy_id": "test-import-twice", "description": "first", "severity": 30, "action": "allow", "match_json": {}},
+                {"policy_id": "test-import-twice", "description": "second", "severity": 40, "action": "block", "match_json": {}},
+            ]
+        }
+        resp = client.post("/policies/import", json=payload, headers=h)
+        assert resp.status_code == 201
+        assert resp.json()["created"] == 1
+        assert resp.json()["skipped"] == 1
+        assert client.get("/policies/test-import-twice", headers=h).json()["description"] == "first"
+
+    def test_import_checks_duplicates_in_one_query(self):
+        from sqlalchemy import event
+        from app.database import engine
+
+        h = _admin_headers()
+        payload = {"policies": [
+            {"policy_id": f"test-import-batch-{i}", "description": "batch", "severity": 10,
+             "action": "allow", "match_json": {}}
+            for i in range(5)
+        ]}
+        selects: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "FROM policies" in statement:
+                selects.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            resp = client.post("/policies/import", json=payload, headers=h)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        assert resp.status_code == 201
+        assert resp.json()["created"] == 5
+        assert len(selects) == 1
+
     def test_import_validates_action(self):
         h = _admin_headers()
         payload = {"policies": [
@@ -636,6 +724,18 @@ class TestAuditTrail:
         assert "before" in edit["changes_json"]
         assert "after" in edit["changes_json"]
 
+    def test_edit_audit_before_covers_changed_fields_only(self):
+        h = _admin_headers()
+        self._create()
+        client.patch("/policies/test-audit-1", json={
+            "match_json": {"tool": "http_request"},
+        }, headers=h)
+        resp = client.get("/policies/audit/trail?policy_id=test-audit-1&action=edit", headers=h)
+        changes = resp.json()[0]["changes_json"]
+        assert set(changes["before"]) == {"match_json", "version"}
+        assert changes["before"]["match_json"] == {"tool": "shell"}
+        assert changes["after"]["match_json"] == {"tool": "http_request"}
+
     def test_archive_generates_audit(self):
         h = _admin_headers()
         self._create()
@@ -87,6 +87,70 @@ class TestEventBus:
         assert q.qsize() == 256
         bus.unsubscribe(q)
 
+    def test_fanout_encodes_once_for_all_subscribers(self):
+        bus = EventBus()
+        q1 = bus.subscribe()
+        q2 = bus.subscribe()
+        event = ActionEvent(
+            event_type="action_evaluated",
+            tool="shell",
+            decision="allow",
+            risk_score=0,
+            explanation="shared",
+            policy_ids=[],
+        )
+        with patch.object(ActionEvent, "to_json_bytes", wraps=event.to_json_bytes) as enc:
+            bus.publish(event)
+            f1 = q1.get_nowait().sse_frame()
+            f2 = q2.get_nowait().sse_frame()
+        assert enc.call_count == 1
+        assert f1 is f2
+        assert f1.startswith(b"event: action_evaluated\ndata: {")
+        assert f1.endswith(b"}\n\n")
+        bus.unsubscribe(q1)
+        bus.unsubscribe(q2)
+
+    def test_started_bus_fans_out_from_drain_task(self):
+        async def scenario():
+            bus = EventBus()
+            q = bus.subscribe()
+            bus.start()
+            event = ActionEvent(
+                event_type="action_evaluated",
+                tool="queued",
+                decision="allow",
+                risk_score=0,
+                explanation="via outbox",
+                policy_ids=[],
+            )
+            # Publish from a worker thread, as sync route handlers do
+            await asyncio.to_thread(bus.publish, event)
+            received = await asyncio.wait_for(q.get(), timeout=1)
+            await bus.stop()
+            return received
+
+        received = asyncio.run(scenario())
+        assert received.tool == "queued"
+
+    def test_stream_generator_unsubscribes_when_cancelled(self):
+        from app.api.routes_stream import CONNECTED_FRAME, _event_generator
+
+        async def scenario():
+            q = action_bus.subscribe()
+            before = action_bus.subscriber_count
+            gen = _event_generator(q)
+            assert await gen.__anext__() == CONNECTED_FRAME
+            # Starlette cancels the stream task on client disconnect
+            pending = asyncio.ensure_future(gen.__anext__())
+            await asyncio.sleep(0)
+            pending.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+            return before, action_bus.subscriber_count
+
+        before, after = asyncio.run(scenario())
+        assert after == before - 1
+
     def test_unsubscribe_nonexistent_is_safe(self):
         bus = EventBus()
         q = asyncio.Queue()
@@ -120,6 +184,19 @@ class TestActionEvent:
         assert data["chain_pattern"] == "recon_exfil"
         assert isinstance(data["timestamp"], float)
 
+    def test_to_json_bytes_matches_to_json(self):
+        event = ActionEvent(
+            event_type="action_evaluated",
+            tool="chat",
+            decision="allow",
+            risk_score=0,
+            explanation="caf\u00e9",
+            policy_ids=[],
+        )
+        raw = event.to_json_bytes()
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == json.loads(event.to_json())
+
 
 # ---------------------------------------------------------------------------
 # SSE endpoint — integration tests
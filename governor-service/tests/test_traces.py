@@ -289,6 +289,20 @@ class TestGovernanceSpanCreation:
         assert gov["attributes"]["governor.tool"] == "file_read"
         assert gov["duration_ms"] is not None
 
+    def test_trace_deep_false_records_summary_only(self):
+        resp = client.post("/actions/evaluate", json={
+            "tool": "file_read",
+            "args": {"path": "/etc/config"},
+            "context": {"trace_id": "test-trace-032", "trace_deep": False},
+        }, headers=_admin_headers())
+        assert resp.status_code == 200
+
+        detail = client.get("/traces/test-trace-032", headers=_admin_headers()).json()
+        gov = [s for s in detail["spans"] if s["kind"] == "governance"][0]
+        assert gov["attributes"]["governor.decision"] == resp.json()["decision"]
+        assert "governor.trace" not in gov["attributes"]
+        assert gov["input"] is None and gov["output"] is None
+
     def test_evaluate_without_trace_id_no_span(self):
         """Evaluating without trace_id in context should NOT create any trace span."""
         # Count existing spans
@@ -401,6 +401,42 @@ class TestNotificationChannelCRUD:
         assert resp.json()["label"] == "test-update-1-renamed"
         assert resp.json()["on_block"] is False
 
+    def test_get_after_update_not_stale(self):
+        h = _admin_headers()
+        create_resp = client.post("/notifications", json={
+            "label": "test-cache-1",
+            "channel_type": "webhook",
+            "config_json": {"url": "https://example.com/v1"},
+        }, headers=h)
+        cid = create_resp.json()["id"]
+        assert client.get(f"/notifications/{cid}", headers=h).json()["label"] == "test-cache-1"
+
+        client.patch(f"/notifications/{cid}", json={
+            "label": "test-cache-1b",
+            "config_json": {"url": "https://example.com/v2"},
+        }, headers=h)
+        resp = client.get(f"/notifications/{cid}", headers=h)
+        assert resp.json()["label"] == "test-cache-1b"
+        assert resp.json()["config_json"]["url"] == "https://example.com/v2"
+
+    def test_read_overtaken_by_invalidation_is_not_cached(self):
+        from app.escalation import channels
+
+        h = _admin_headers()
+        cid = client.post("/notifications", json={
+            "label": "test-cache-race",
+            "channel_type": "webhook",
+            "config_json": {"url": "https://example.com/old"},
+        }, headers=h).json()["id"]
+        stale = channels.NotificationChannelRead(**client.get(f"/notifications/{cid}", headers=h).json())
+
+        # A GET read the old row, then a PATCH committed and invalidated
+        gen = channels.channel_cache_generation()
+        client.patch(f"/notifications/{cid}", json={"label": "test-cache-race-new"}, headers=h)
+        channels.cache_channel_read(stale, gen)
+
+        assert client.get(f"/notifications/{cid}", headers=h).json()["label"] == "test-cache-race-new"
+
     def test_delete_channel(self):
         h = _admin_headers()
         create_resp = client.post("/notifications", json={
@@ -482,3 +518,23 @@ class TestNotificationChannelConfig:
         }, headers=h)
         assert resp.status_code == 200
         assert resp.json()["config_json"]["smtp_host"] == "new.com"
+
+    def test_patch_unchanged_config_keeps_ciphertext(self):
+        from app.database import db_session
+        from app.escalation.models import NotificationChannel
+
+        h = _admin_headers()
+        cfg = {"url": "https://example.com/same"}
+        cid = client.post("/notifications", json={
+            "label": "test-idempotent", "channel_type": "webhook", "config_json": cfg,
+        }, headers=h).json()["id"]
+        with db_session() as session:
+            before = session.get(NotificationChannel, cid).config_json
+
+        resp = client.patch(f"/notifications/{cid}", json={
+            "label": "test-idempotent", "config_json": cfg,
+        }, headers=h)
+        assert resp.status_code == 200
+        assert resp.json()["config_json"] == cfg
+        with db_session() as session:
+            assert session.get(NotificationChannel, cid).config_json == before